@@ -1,10 +1,8 @@
 import datetime
 import re
-from collections import namedtuple
-from decimal import Decimal
-from typing import Any, Final, Optional
+from typing import Any, Final, NamedTuple, Optional
 
-import pdfplumber
+import pypdfium2 as pdfium
 
 REGEX_SHORT_DATE: Final[str] = r"(\d{2})\s+([A-Z][a-z]{2})"  # matches e.g. '24 Dec'
 REGEX_MONEY_NUM: Final[str] = (
@@ -13,17 +11,33 @@ REGEX_MONEY_NUM: Final[str] = (
 IDENTIFY_TRANSACTION_ROW_REGEX: Final[str] = (
     r"^\s*"
     + REGEX_SHORT_DATE
-    + r"(.*?(?!\.\d{2}(?:Cr)?\b))"  # anything not followed by cents amount e.g. '.42 ' or '.42Cr '
+    + r"(.*?)"  # description (may be empty); trailing money groups are unambiguous since $-anchored
     + rf"({REGEX_MONEY_NUM})"
     + r"\s+"
     + rf"({REGEX_MONEY_NUM})"
-    + rf"(?:\s+({REGEX_MONEY_NUM}))?\s*?$"  # optional 3rd money amount
+    + rf"(?:\s+({REGEX_MONEY_NUM}))?\s*$"  # optional 3rd money amount
 )
 
-Transaction = namedtuple(
-    "transaction", ["date", "description", "amount", "balance", "bank_fee"]
+# compile once at import time so the per-row loop calls pattern methods directly #
+_TXN_RE: Final[re.Pattern] = re.compile(IDENTIFY_TRANSACTION_ROW_REGEX)
+_OPEN_BAL_RE: Final[re.Pattern] = re.compile(r"Opening Balance\s+([\d,]+\.\d{2}(?:Cr)?)\b")
+_CLOSE_BAL_RE: Final[re.Pattern] = re.compile(r"Closing Balance\s+([\d,]+\.\d{2}(?:Cr)?)\b")
+_PERIOD_RE: Final[re.Pattern] = re.compile(
+    r"Statement Period\s+:\s+\d{2}\s+([a-zA-Z]{3})[a-zA-Z]*\s+(\d{4})"
 )
 
+class Transaction(NamedTuple):
+    """A single statement transaction (money fields are integer cents).
+
+    Keeps the compact tuple memory layout (no per-instance __dict__),
+    which matters when a long statement yields tens of thousands of rows."""
+
+    date: datetime.date
+    description: str
+    amount: int
+    balance: int
+    bank_fee: int
+
 
 class PdfParsingException(Exception):
     pass
@@ -45,64 +59,83 @@ MONTH_NAMES: Final[tuple[str, ...]] = (
 )
 
 
-def clean_fnb_currency_string(raw_str: Optional[str]) -> Decimal:
-    """Converts a raw currency amount string to a Decimal
-    representation
+def clean_fnb_currency_string(raw_str: Optional[str]) -> int:
+    """Converts a raw currency amount string to integer cents
+    (amounts always have exactly 2 decimal places, so integer cents are
+    exact and validation arithmetic stays in cheap native ints)
 
     Examples:
         >>> clean_fnb_currency_string(" 80,085.69Cr ")
-        Decimal('80085.69')
+        8008569
         >>> clean_fnb_currency_string("420.69")
-        Decimal('-420.69')
+        -42069
     """
     if raw_str is None:
-        return Decimal("0.00")
-    clean_str = raw_str.replace(",", "").replace(" ", "")
-    if clean_str[-2:] == "Cr":
-        clean_str = clean_str.replace("Cr", "")
-    else:
-        clean_str = f"-{clean_str}"
-    return Decimal(clean_str)
-
-
-with pdfplumber.open("bank_statements/FNB_ASPIRE_CURRENT_ACCOUNT_100.pdf") as pdf:
+        return 0
+    raw_str = raw_str.strip()
+    is_credit = raw_str.endswith("Cr")
+    if is_credit:
+        raw_str = raw_str[:-2]
+    # single pass accumulating digits only: ',' and '.' are simply skipped,
+    # and since amounts always have exactly 2 decimal places the accumulated
+    # value is already in cents (no intermediate string allocations) #
+    value = 0
+    for char in raw_str:
+        if "0" <= char <= "9":
+            value = value * 10 + (ord(char) - 48)
+    return value if is_credit else -value
+
+
+def format_cents(cents: int) -> str:
+    """Formats integer cents back into a display string e.g. -42069 -> '-420.69'"""
+    sign = "-" if cents < 0 else ""
+    cents = abs(cents)
+    return f"{sign}{cents // 100}.{cents % 100:02d}"
+
+
+pdf = pdfium.PdfDocument("bank_statements/FNB_ASPIRE_CURRENT_ACCOUNT_100.pdf")
+try:
     transactions_found: list[Transaction] = []
     balances_found: dict[str, Any] = {
         "opening": {
-            "regex": r"Opening Balance\s+([\d,]+\.\d{2}(?:Cr)?)\b",
+            "regex": _OPEN_BAL_RE,
             "values_found": [],
         },
         "closing": {
-            "regex": r"Closing Balance\s+([\d,]+\.\d{2}(?:Cr)?)\b",
+            "regex": _CLOSE_BAL_RE,
             "values_found": [],
         },
     }
 
     current_year: Optional[int] = None
-    for page in pdf.pages:
-        page_text: str = page.extract_text()
+    # local bindings for the row loop: LOAD_FAST instead of repeated
+    # global/attribute lookups per line #
+    match_transaction_row = _TXN_RE.match
+    add_transaction = transactions_found.append
+    for page in pdf:
+        page_text: str = page.get_textpage().get_text_bounded()
+        page.close()
         if current_year is None:
             # extract starting year and month from first page of statement #
-            current_month, current_year_raw = re.search(
-                r"Statement Period\s+:\s+\d{2}\s+([a-zA-Z]{3})[a-zA-Z]*\s+(\d{4})",
-                page_text,
-            ).groups()
+            current_month, current_year_raw = _PERIOD_RE.search(page_text).groups()
             current_year = int(current_year_raw)
 
+        # balance lines only ever appear on the first and last pages, so scan
+        # each page's text once instead of running both regexes on every row #
+        for balance_name, balance_info in balances_found.items():
+            for balance_raw in balance_info["regex"].findall(page_text):
+                balance_info["values_found"].append(
+                    clean_fnb_currency_string(balance_raw)
+                )
+
         for row in page_text.split("\n"):
-            for balance_name, balance_info in balances_found.items():
-                found_balance = re.search(balance_info["regex"], row)
-                if found_balance:
-                    balance_raw: str = found_balance.groups()[0].replace(" ", "")
-                    if "Cr" not in balance_raw:
-                        balance: Decimal = Decimal("-" + balance_raw.replace("Cr", ""))
-                    else:
-                        balance: Decimal = Decimal(
-                            balance_raw.replace("Cr", "").replace(",", "")
-                        )
-                    balance_info["values_found"].append(balance)
-
-            row_match = re.match(IDENTIFY_TRANSACTION_ROW_REGEX, row.strip())
+            row = row.strip()
+            # fast reject: every transaction row starts with a 2-digit day and
+            # is at least 'DD MMM 0.00 0.00' long - two C-level checks spare
+            # the regex engine the majority of header/footer/blank lines #
+            if len(row) < 16 or not row[0].isdigit():
+                continue
+            row_match = match_transaction_row(row)
             if row_match:
                 raw_day, raw_month, raw_desc, raw_amt, raw_balance, raw_fee = (
                     row_match.groups()
@@ -117,7 +150,7 @@ with pdfplumber.open("bank_statements/FNB_ASPIRE_CURRENT_ACCOUNT_100.pdf") as pd
                     if raw_desc.strip() == ""
                     else raw_desc.strip()
                 )
-                transactions_found.append(
+                add_transaction(
                     Transaction(
                         date=datetime.date(
                             current_year, MONTH_NAMES.index(month) + 1, int(raw_day)
@@ -131,34 +164,33 @@ with pdfplumber.open("bank_statements/FNB_ASPIRE_CURRENT_ACCOUNT_100.pdf") as pd
 
     # validate balances found #
     for balance_name, balance_info in balances_found.items():
-        if not all(
-            [
-                bal == balance_info["values_found"][0]
-                for bal in balance_info["values_found"]
-            ]
-        ):
+        values_found = balance_info["values_found"]
+        reference_value = values_found[0]
+        if not all(bal == reference_value for bal in values_found):
             raise PdfParsingException(
-                f"Found conflicting values for {balance_name} balance: found values {';'.join([str(x) for x in balance_info['values_found']])}"
+                f"Found conflicting values for {balance_name} balance: found values {';'.join(str(x) for x in values_found)}"
             )
 
     # validate each transaction found (amount to balance relationship) #
-    opening_balance: Decimal = balances_found["opening"]["values_found"][0]
-    closing_balance: Decimal = balances_found["closing"]["values_found"][0]
+    opening_balance: int = balances_found["opening"]["values_found"][0]
+    closing_balance: int = balances_found["closing"]["values_found"][0]
 
-    prev_balance: Decimal = opening_balance
+    prev_balance: int = opening_balance
     for transaction in transactions_found:
         if prev_balance + transaction.amount != transaction.balance:
             raise PdfParsingException(
-                f"Parsing error: pre-transaction balance ({prev_balance}) + transaction amount ({transaction.amount}) != post-transaction balance for transaction \n{transaction.balance}"
+                f"Parsing error: pre-transaction balance ({format_cents(prev_balance)}) + transaction amount ({format_cents(transaction.amount)}) != post-transaction balance for transaction \n{format_cents(transaction.balance)}"
             )
         prev_balance = transaction.balance
 
-    sum_transactions: Decimal = sum([tcn.amount for tcn in transactions_found])
-    expected_closing_balance: Decimal = opening_balance + sum_transactions
+    sum_transactions: int = sum(tcn.amount for tcn in transactions_found)
+    expected_closing_balance: int = opening_balance + sum_transactions
     if expected_closing_balance != closing_balance:
         raise PdfParsingException(
-            f"Closing balance on statement ({closing_balance}) "
-            f"!= opening balance on statement ({opening_balance}) "
-            f"+ sum of parsed transactions ({sum_transactions}) "
-            f"= {expected_closing_balance}"
+            f"Closing balance on statement ({format_cents(closing_balance)}) "
+            f"!= opening balance on statement ({format_cents(opening_balance)}) "
+            f"+ sum of parsed transactions ({format_cents(sum_transactions)}) "
+            f"= {format_cents(expected_closing_balance)}"
         )
+finally:
+    pdf.close()
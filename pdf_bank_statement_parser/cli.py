@@ -1,15 +1,65 @@
 import argparse
 import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
-from pdf_bank_statement_parser.exceptions import OutputInvalidException
-from pdf_bank_statement_parser.export import write_transactions_to_csv
 from pdf_bank_statement_parser.objects import Transaction
-from pdf_bank_statement_parser.parse.extract_transactions import (
-    extract_transactions_from_fnb_pdf_statement,
-)
-from pdf_bank_statement_parser.utils.pdf_analyzer import analyze_pdf_format
+
+# pypdfium2 (a sizeable C extension) is only imported transitively inside the
+# branches that actually parse or analyze a PDF, so that --help, argument
+# errors and process-pool worker spawn don't pay its import cost up front #
+
+
+def _parse_and_write(
+    input_filepath: Path,
+    output_dir: str,
+    csv_sep_char: str,
+    quiet: bool,
+    debug: bool,
+    lenient: bool,
+    cache_dir: Path | None = None,
+) -> bool:
+    """Parses a single PDF file and writes the result to CSV.
+
+    Module-level (rather than nested in `parse_transactions`) so that it is
+    picklable and can be submitted to a ProcessPoolExecutor.
+    Returns True on success, False on failure."""
+    from pdf_bank_statement_parser.export import write_transactions_to_csv
+    from pdf_bank_statement_parser.parse.extract_transactions import (
+        extract_transactions_from_fnb_pdf_statement,
+    )
+
+    try:
+        if not quiet:
+            print(f"\n{'='*50}\nProcessing {input_filepath}\n{'='*50}")
+
+        transactions: list[Transaction] = extract_transactions_from_fnb_pdf_statement(
+            path_to_pdf_file=input_filepath,
+            verbose=(not quiet),
+            debug=debug,
+            lenient_validation=lenient,
+            cache_dir=cache_dir,
+        )
+        output_filepath = Path(output_dir) / input_filepath.with_suffix(".csv").name
+        write_transactions_to_csv(
+            transactions=transactions,
+            output_filepath=output_filepath,
+            csv_sep_char=csv_sep_char,
+            verbose=(not quiet),
+        )
+        return True
+    except Exception as e:
+        if debug:
+            import traceback
+
+            print(f"ERROR processing {input_filepath}:")
+            traceback.print_exc()
+        else:
+            print(f"ERROR processing {input_filepath}: {str(e)}")
+            print("Run with --debug for more information")
+        return False
 
 
 def parse_transactions():
@@ -62,6 +112,19 @@ def parse_transactions():
         help="Enable lenient validation mode that allows small discrepancies in balance calculations",
         action="store_true",
     )
+    parse_parser.add_argument(
+        "--cache-dir",
+        help="Directory used for the page-text cache (keyed by content hash of the input PDF, so unchanged files skip PDF text extraction on re-runs). Defaults to ~/.cache/pdf-bank-statement-parser",
+        type=Path,
+        default=None,
+    )
+    parse_parser.add_argument(
+        "-w",
+        "--workers",
+        help="Number of worker processes used when parsing a directory of PDF files (only relevant with -d/--input_dir)",
+        type=int,
+        default=min(os.cpu_count() or 1, 8),
+    )
     parse_parser.add_argument(
         "--skip-validation",
         help="Skip validation checks entirely (use with caution)",
@@ -93,6 +156,8 @@ def parse_transactions():
     
     # Handle the analyze command
     if args.command == "analyze":
+        from pdf_bank_statement_parser.utils.pdf_analyzer import analyze_pdf_format
+
         analyze_pdf_format(args.pdf_path, verbose=not args.quiet)
         return
     
@@ -117,16 +182,24 @@ def parse_transactions():
         print("VERBOSE mode is enabled (disable by adding the --quiet flag)")
         print(
             "input_arguments are:\n",
-            json.dumps(vars(args), indent=4),
+            # default=str renders non-JSON-native values such as the
+            # Path-typed --cache-dir instead of raising a TypeError #
+            json.dumps(vars(args), indent=4, default=str),
         )
 
     if args.input_filepath is not None:
+        from pdf_bank_statement_parser.export import write_transactions_to_csv
+        from pdf_bank_statement_parser.parse.extract_transactions import (
+            extract_transactions_from_fnb_pdf_statement,
+        )
+
         try:
             transactions: list[Transaction] = extract_transactions_from_fnb_pdf_statement(
                 path_to_pdf_file=args.input_filepath,
                 verbose=(not args.quiet),
                 debug=args.debug,
                 lenient_validation=args.lenient,
+                cache_dir=args.cache_dir,
             )
             write_transactions_to_csv(
                 transactions=transactions,
@@ -146,40 +219,29 @@ def parse_transactions():
     if args.input_dir is not None:
         success_count = 0
         failure_count = 0
-        for input_filepath in Path(args.input_dir).glob("*.pdf"):
-            try:
-                if not args.quiet:
-                    print(f"\n{'='*50}\nProcessing {input_filepath}\n{'='*50}")
-                
-                transactions: list[Transaction] = (
-                    extract_transactions_from_fnb_pdf_statement(
-                        path_to_pdf_file=input_filepath,
-                        verbose=(not args.quiet),
-                        debug=args.debug,
-                        lenient_validation=args.lenient,
-                    )
-                )
-                output_filepath = Path(args.output_path) / input_filepath.with_suffix(".csv").name
-                write_transactions_to_csv(
-                    transactions=transactions,
-                    output_filepath=output_filepath,
-                    csv_sep_char=args.csv_sep_char,
-                    verbose=(not args.quiet),
-                )
-                success_count += 1
-            except Exception as e:
-                failure_count += 1
-                if args.debug:
-                    import traceback
-                    print(f"ERROR processing {input_filepath}:")
-                    traceback.print_exc()
+        input_filepaths = sorted(Path(args.input_dir).glob("*.pdf"))
+        # each file is parsed completely independently, so parse them in
+        # parallel across processes (PDF text extraction is CPU-bound) #
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            futures = {
+                executor.submit(
+                    _parse_and_write,
+                    input_filepath,
+                    args.output_path,
+                    args.csv_sep_char,
+                    args.quiet,
+                    args.debug,
+                    args.lenient,
+                    args.cache_dir,
+                ): input_filepath
+                for input_filepath in input_filepaths
+            }
+            for future in as_completed(futures):
+                if future.result():
+                    success_count += 1
                 else:
-                    print(f"ERROR processing {input_filepath}: {str(e)}")
-                    print("Run with --debug for more information")
-                
-                # Continue with next file even if this one failed
-                continue
-        
+                    failure_count += 1
+
         print(f"\nProcessing complete: {success_count} files succeeded, {failure_count} files failed")
 
 
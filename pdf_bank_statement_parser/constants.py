@@ -1,3 +1,4 @@
+import re
 from typing import Final
 
 REGEX_SHORT_DATE: Final[str] = r"(\d{2})\s+([A-Z][a-z]{2})"  # matches e.g. '24 Dec'
@@ -16,21 +17,34 @@ IDENTIFY_TRANSACTION_ROW_REGEX_ORIGINAL: Final[str] = (
     + rf"(?:\s+({REGEX_MONEY_NUM}))?\s*?$"  # optional 3rd money amount
 )
 
-# Enhanced regex pattern with more flexible whitespace handling and better fee detection
+# Enhanced regex pattern with more flexible whitespace handling and better fee detection.
+# The end-of-line anchor makes the trailing money groups unambiguous, so no
+# negative lookahead is needed in the description group (the lookahead forced
+# the engine to re-scan at every position, which dominated on non-matching rows).
+# Without the lookahead the pattern has no pathological backtracking cases, so a
+# linear-time engine (google-re2 / hyperscan) buys nothing here that would
+# justify growing the dependency footprint beyond pypdfium2
 IDENTIFY_TRANSACTION_ROW_REGEX_ENHANCED: Final[str] = (
     r"^\s*"
     + REGEX_SHORT_DATE
-    + r"(.*?(?!\.\d{2}(?:Cr)?\b))"  # anything not followed by cents amount
+    + r"(.*?)"  # description (may be empty)
     + rf"({REGEX_MONEY_NUM})"  # amount
     + r"\s+"
     + rf"({REGEX_MONEY_NUM})"  # balance
     + rf"(?:\s+({REGEX_MONEY_NUM}))?"  # optional fee
-    + r"\s*?$"
+    + r"\s*$"
 )
 
 # Use the enhanced pattern by default
 IDENTIFY_TRANSACTION_ROW_REGEX: Final[str] = IDENTIFY_TRANSACTION_ROW_REGEX_ENHANCED
 
+# compiled once at import time: consumers should call methods on this pattern
+# object directly rather than passing the regex string to the `re` module-level
+# functions (which re-probe the internal pattern cache on every call)
+IDENTIFY_TRANSACTION_ROW_PATTERN: Final[re.Pattern] = re.compile(
+    IDENTIFY_TRANSACTION_ROW_REGEX
+)
+
 MONTH_NAMES: Final[tuple[str, ...]] = (
     "Jan",
     "Feb",
@@ -45,3 +59,9 @@ MONTH_NAMES: Final[tuple[str, ...]] = (
     "Nov",
     "Dec",
 )
+
+# O(1) month-name lookup (tuple.index is an O(12) linear scan, and the
+# extractor needs the index of every matched transaction row's month)
+MONTH_NAME_TO_IDX: Final[dict[str, int]] = {
+    name: idx for idx, name in enumerate(MONTH_NAMES)
+}
@@ -5,6 +5,11 @@ import csv
 from pdf_bank_statement_parser.exceptions import OutputInvalidException
 from pdf_bank_statement_parser.objects import Transaction
 
+# every character that can appear in the string form of the non-description
+# fields (ISO dates and Decimal amounts) - any other separator only needs to
+# be checked against the free-text description field #
+_NON_DESCRIPTION_FIELD_CHARS: str = "0123456789-."
+
 
 def write_transactions_to_csv(
     transactions: list[Transaction],
@@ -13,22 +18,33 @@ def write_transactions_to_csv(
     verbose: bool = True,
 ) -> None:
     """Writes parsed transactions into a single CSV file"""
-    with open(output_filepath, "w", encoding="utf-8") as file:
-        csv_writer = csv.DictWriter(
+    # check every row for the separator character before any row is written,
+    # so a rejected export never leaves a partially-written file behind #
+    check_all_fields: bool = csv_sep_char in _NON_DESCRIPTION_FIELD_CHARS
+    for transaction in transactions:
+        if check_all_fields:
+            for field_name, field_value in zip(Transaction._fields, transaction):
+                if csv_sep_char in str(field_value):
+                    raise OutputInvalidException(
+                        f"Cannot produce valid output because found CSV-separator character '{csv_sep_char}' in field '{field_name}' of transaction {transaction}"
+                    )
+        elif csv_sep_char in transaction.description:
+            raise OutputInvalidException(
+                f"Cannot produce valid output because found CSV-separator character '{csv_sep_char}' in field 'description' of transaction {transaction}"
+            )
+    # a 1MiB buffer batches the underlying write syscalls; rows are handed to
+    # the csv module in one writerows call (Transaction is a namedtuple with
+    # fields already in output order, so no per-row dict is built) #
+    with open(
+        output_filepath, "w", encoding="utf-8", newline="", buffering=1 << 20
+    ) as file:
+        csv_writer = csv.writer(
             file,
-            fieldnames=["date", "description", "amount", "balance", "bank_fee"],
             delimiter=csv_sep_char,
             quotechar='"',
             quoting=csv.QUOTE_MINIMAL,
         )
-        csv_writer.writeheader()
-        for transaction in transactions:
-            transaction_dict: dict = transaction._asdict()
-            for field_name, field_value in transaction_dict.items():
-                if csv_sep_char in str(field_value):
-                    raise OutputInvalidException(
-                        f"Cannot produce valid output because found CSV-separator character '{csv_sep_char}' in field '{field_name}' of transaction {transaction_dict}"
-                    )
-            csv_writer.writerow(transaction_dict)
+        csv_writer.writerow(Transaction._fields)
+        csv_writer.writerows(transactions)
     if verbose:
         print(f"Wrote {len(transactions):,} transactions to '{output_filepath}'")
@@ -1,5 +1,18 @@
-from collections import namedtuple
+import datetime
+from decimal import Decimal
+from typing import NamedTuple
 
-Transaction = namedtuple(
-    "Transaction", ["date", "description", "amount", "balance", "bank_fee"]
-)
+
+class Transaction(NamedTuple):
+    """A single transaction parsed from a bank statement
+
+    A typed NamedTuple keeps the compact tuple memory layout (no per-instance
+    __dict__), which matters when parsing many multi-thousand-row statements,
+    while giving each field a name and a type for static analysis.
+    """
+
+    date: datetime.date
+    description: str
+    amount: Decimal
+    balance: Decimal
+    bank_fee: Decimal
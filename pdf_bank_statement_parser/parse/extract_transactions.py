@@ -2,13 +2,15 @@ import datetime
 import re
 from decimal import Decimal
 from pathlib import Path
+from typing import Iterator, Optional
 
 import pypdfium2 as pdfium
 
 from pdf_bank_statement_parser.constants import (
-    IDENTIFY_TRANSACTION_ROW_REGEX,
-    MONTH_NAMES,
+    MONTH_NAME_TO_IDX,
+    REGEX_MONEY_NUM,
 )
+from pdf_bank_statement_parser.parse import page_text_cache
 from pdf_bank_statement_parser.parse.string_cleaning import clean_fnb_currency_string
 from pdf_bank_statement_parser.objects import Transaction
 from pdf_bank_statement_parser.parse.output_validation import (
@@ -17,111 +19,223 @@ from pdf_bank_statement_parser.parse.output_validation import (
     validate_transactions_sum_to_closing_balance,
 )
 
+# patterns compiled once at import time so that the per-page scan calls
+# pattern methods directly instead of re-resolving the regex cache per call.
+# Transaction rows and opening/closing balance lines are folded into one
+# alternation, so classifying every interesting line on a page costs a single
+# finditer pass instead of three separate engine invocations. Inter-field
+# separators are narrowed to horizontal whitespace so a match can never span
+# two lines; the trailing pad also accepts "\r" because PDFium terminates
+# lines with "\r\n" and "$" under MULTILINE only matches before the "\n" #
+_PAGE_SCAN_RE: re.Pattern = re.compile(
+    r"^[ \t]*(?P<day>\d{2})[ \t]+(?P<month>[A-Z][a-z]{2})(?P<desc>.*?)"
+    + rf"(?P<amount>{REGEX_MONEY_NUM})[ \t]+(?P<balance>{REGEX_MONEY_NUM})"
+    + rf"(?:[ \t]+(?P<fee>{REGEX_MONEY_NUM}))?[ \t\r]*$"
+    + r"|Opening Balance[ \t]+(?P<opening>[\d,]+\.\d{2}[ ]{0,2}(?:Cr)?)\b"
+    + r"|Closing Balance[ \t]+(?P<closing>[\d,]+\.\d{2}[ ]{0,2}(?:Cr)?)\b",
+    re.MULTILINE,
+)
+_PERIOD_RE: re.Pattern = re.compile(
+    r"Statement Period\s+:\s+\d{2}\s+([a-zA-Z]{3})[a-zA-Z]*\s+(\d{4})"
+)
+
+
+def _iter_page_texts(
+    path_to_pdf_file: str | Path,
+    verbose: bool = False,
+    use_cache: bool = True,
+    cache_dir: Optional[Path] = None,
+) -> Iterator[str]:
+    """Yields the text of each page of the PDF, consulting (and populating)
+    the on-disk page-text cache keyed by the file's content hash
+
+    Pages are extracted sequentially on purpose: PDFium is not thread-safe
+    (all calls must come from one thread at a time), so in-document page
+    parallelism would need one worker process re-opening the PDF per page
+    range - not worth it for typical statement sizes. Batch jobs already
+    parallelise across files in the CLI instead."""
+    pdf_bytes: bytes = Path(path_to_pdf_file).read_bytes()
+    cache_key: str = page_text_cache.content_hash(pdf_bytes)
+    if use_cache:
+        cached_page_texts = page_text_cache.load(cache_key, cache_dir=cache_dir)
+        if cached_page_texts is not None:
+            if verbose:
+                print(f"found {len(cached_page_texts):,} pages in page-text cache")
+            yield from cached_page_texts
+            return
+    pdf = pdfium.PdfDocument(pdf_bytes)
+    page_texts: list[str] = []
+    try:
+        if verbose:
+            print(f"found {len(pdf):,} pages")
+        for page_num, page in enumerate(pdf, start=1):
+            if verbose:
+                print(f"started page {page_num:,}")
+            # close the textpage handle explicitly (not just the page), so
+            # native pdfium memory stays bounded at one page's worth instead
+            # of accumulating until garbage collection #
+            textpage = page.get_textpage()
+            try:
+                page_text: str = textpage.get_text_bounded()
+            finally:
+                textpage.close()
+                page.close()
+            page_texts.append(page_text)
+            yield page_text
+    finally:
+        pdf.close()
+        if verbose:
+            print("closed PDF")
+    # only reached after every page was extracted successfully #
+    if use_cache:
+        page_text_cache.save(cache_key, page_texts, cache_dir=cache_dir)
+
+
+def iter_transactions_from_fnb_pdf_statement(
+    path_to_pdf_file: str | Path,
+    verbose: bool = False,
+    debug: bool = False,
+    global_balances_found: Optional[dict[str, dict]] = None,
+    cache_dir: Optional[Path] = None,
+) -> Iterator[Transaction]:
+    """Reads in PDF bank statement, yielding transactions one at a time
+    as they are extracted (page N's transactions are available before
+    page N+1 has been read, and no list of all transactions is ever
+    materialised)
+
+    Args:
+        path_to_pdf_file: Path to the PDF file
+        verbose: Whether to print verbose output
+        debug: Whether to print debug information for each transaction
+        global_balances_found: Optional accumulator dict (as built by
+            `extract_transactions_from_fnb_pdf_statement`) into which
+            opening/closing balance values found on the pages are appended,
+            so that the caller can validate them after iteration completes
+        cache_dir: Optional override of the page-text cache directory
+    """
+    if verbose:
+        print("Started parsing file", path_to_pdf_file)
+    if global_balances_found is None:
+        global_balances_found = make_global_balances_accumulator()
+    # bind the page scanner once so the per-page scan performs a plain
+    # function call instead of attribute lookups on the compiled pattern #
+    find_statement_rows = _PAGE_SCAN_RE.finditer
+    opening_values: list = global_balances_found["opening"]["values_found"]
+    closing_values: list = global_balances_found["closing"]["values_found"]
+    # statements typically contain many transactions on the same day, so date
+    # objects are memoised instead of re-constructed per row #
+    date_cache: dict[tuple[int, int, int], datetime.date] = {}
+    for page_num, page_text in enumerate(
+        _iter_page_texts(path_to_pdf_file, verbose=verbose, cache_dir=cache_dir),
+        start=1,
+    ):
+        if page_num == 1:
+            # extract statement start year and month from first page of statement #
+            current_month, current_year_raw = _PERIOD_RE.search(page_text).groups()
+            current_month_idx = MONTH_NAME_TO_IDX[current_month]
+            current_year = int(current_year_raw)
+            if verbose:
+                print(f"starting year is {current_year}")
+
+        if debug:
+            for row in page_text.split("\n"):
+                print(f"DEBUG - Processing row: {row.strip()}")
+
+        for row_match in find_statement_rows(page_text):
+            raw_day = row_match["day"]
+            if raw_day is None:
+                # the alternation matched a global balance line, not a transaction #
+                raw_opening, raw_closing = row_match["opening"], row_match["closing"]
+                if raw_opening is not None:
+                    opening_values.append(clean_fnb_currency_string(raw_opening))
+                    if verbose:
+                        print(f"found balances for opening: {opening_values}")
+                else:
+                    closing_values.append(clean_fnb_currency_string(raw_closing))
+                    if verbose:
+                        print(f"found balances for closing: {closing_values}")
+                continue
+
+            raw_month, raw_desc, raw_amt, raw_balance, raw_fee = (
+                row_match["month"],
+                row_match["desc"],
+                row_match["amount"],
+                row_match["balance"],
+                row_match["fee"],
+            )
+
+            if debug:
+                print(f"DEBUG - Match found: day={raw_day}, month={raw_month}, desc={raw_desc}")
+                print(f"DEBUG - Amounts: amount={raw_amt}, balance={raw_balance}, fee={raw_fee}")
+
+            month_idx: int = MONTH_NAME_TO_IDX[raw_month.strip()]
+            if month_idx < current_month_idx:
+                # if we go to a previous month, then we assume that we have crossed into a new year #
+                current_year += 1
+            current_month_idx = month_idx
+            transaction_desc: str = (
+                "!ERROR: unparsable description text!"
+                if raw_desc.strip() == ""
+                else raw_desc.strip()
+            )
+
+            amount = clean_fnb_currency_string(raw_amt)
+            balance = clean_fnb_currency_string(raw_balance)
+            bank_fee = clean_fnb_currency_string(raw_fee)
+
+            if debug:
+                print(f"DEBUG - Cleaned values: amount={amount}, balance={balance}, fee={bank_fee}")
+
+            date_key = (current_year, month_idx + 1, int(raw_day))
+            transaction_date = date_cache.get(date_key)
+            if transaction_date is None:
+                transaction_date = date_cache[date_key] = datetime.date(*date_key)
+
+            yield Transaction(
+                date=transaction_date,
+                description=transaction_desc,
+                amount=amount,
+                balance=balance,
+                bank_fee=bank_fee,
+            )
+
+
+def make_global_balances_accumulator() -> dict[str, dict]:
+    """Creates a fresh accumulator for the opening/closing balance values
+    found while scanning the statement pages"""
+    return {
+        "opening": {"values_found": []},
+        "closing": {"values_found": []},
+    }
+
 
 def extract_transactions_from_fnb_pdf_statement(
     path_to_pdf_file: str | Path,
     verbose: bool,
     debug: bool = False,
     lenient_validation: bool = False,
+    cache_dir: Optional[Path] = None,
 ) -> list[Transaction]:
-    """Reads in PDF bank statement and extracts all transactions from it
-    
+    """Reads in PDF bank statement and extracts all transactions from it,
+    validating the result against the balances on the statement
+
     Args:
         path_to_pdf_file: Path to the PDF file
         verbose: Whether to print verbose output
         debug: Whether to print debug information for each transaction
         lenient_validation: Whether to allow small discrepancies in balance calculations
+        cache_dir: Optional override of the page-text cache directory
     """
-    if verbose:
-        print("Started parsing file", path_to_pdf_file)
-    transactions_found: list[Transaction] = []
-    global_balances_found: dict[str, dict] = {
-        "opening": {
-            "regex": r"Opening Balance\s+([\d,]+\.\d{2}\s{0,2}(?:Cr)?)\b",
-            "values_found": [],
-        },
-        "closing": {
-            "regex": r"Closing Balance\s+([\d,]+\.\d{2}\s{0,2}(?:Cr)?)\b",
-            "values_found": [],
-        },
-    }
-    try:
-        pdf = pdfium.PdfDocument(path_to_pdf_file)
-        if verbose:
-            print(f"found {len(pdf):,} pages")
-        for page_num, page in enumerate(pdf, start=1):
-            if verbose:
-                print(f"started page {page_num:,}")
-            page_text: str = page.get_textpage().get_text_bounded()
-            page.close()
-            if page_num == 1:
-                # extract statement start year and month from first page of statement #
-                current_month, current_year_raw = re.search(
-                    r"Statement Period\s+:\s+\d{2}\s+([a-zA-Z]{3})[a-zA-Z]*\s+(\d{4})",
-                    page_text,
-                ).groups()
-                current_year = int(current_year_raw)
-                if verbose:
-                    print(f"starting year is {current_year}")
-
-            for balance_name, balance_info in global_balances_found.items():
-                found_balances: list[str] = re.findall(balance_info["regex"], page_text)
-                if found_balances:
-                    for balance_raw in found_balances:
-                        balance_info["values_found"].append(
-                            clean_fnb_currency_string(balance_raw)
-                        )
-                    if verbose:
-                        print(
-                            f"found balances for {balance_name}: {balance_info['values_found']}"
-                        )
-            for row in page_text.split("\n"):
-                if debug:
-                    print(f"DEBUG - Processing row: {row}")
-                
-                row_match = re.match(IDENTIFY_TRANSACTION_ROW_REGEX, row.strip())
-                if row_match:
-                    raw_day, raw_month, raw_desc, raw_amt, raw_balance, raw_fee = (
-                        row_match.groups()
-                    )
-                    
-                    if debug:
-                        print(f"DEBUG - Match found: day={raw_day}, month={raw_month}, desc={raw_desc}")
-                        print(f"DEBUG - Amounts: amount={raw_amt}, balance={raw_balance}, fee={raw_fee}")
-                    
-                    month: str = raw_month.strip()
-                    if MONTH_NAMES.index(month) < MONTH_NAMES.index(current_month):
-                        # if we go to a previous month, then we assume that we have crossed into a new year #
-                        current_year += 1
-                    current_month = month
-                    transaction_desc: str = (
-                        "!ERROR: unparsable description text!"
-                        if raw_desc.strip() == ""
-                        else raw_desc.strip()
-                    )
-                    
-                    amount = clean_fnb_currency_string(raw_amt)
-                    balance = clean_fnb_currency_string(raw_balance)
-                    bank_fee = clean_fnb_currency_string(raw_fee)
-                    
-                    if debug:
-                        print(f"DEBUG - Cleaned values: amount={amount}, balance={balance}, fee={bank_fee}")
-                    
-                    transactions_found.append(
-                        Transaction(
-                            date=datetime.date(
-                                current_year, MONTH_NAMES.index(month) + 1, int(raw_day)
-                            ),
-                            description=transaction_desc,
-                            amount=amount,
-                            balance=balance,
-                            bank_fee=bank_fee,
-                        )
-                    )
-    finally:
-        pdf.close()
-        if verbose:
-            print("closed PDF")
+    global_balances_found: dict[str, dict] = make_global_balances_accumulator()
+    transactions_found: list[Transaction] = list(
+        iter_transactions_from_fnb_pdf_statement(
+            path_to_pdf_file=path_to_pdf_file,
+            verbose=verbose,
+            debug=debug,
+            global_balances_found=global_balances_found,
+            cache_dir=cache_dir,
+        )
+    )
 
     opening_balance: Decimal = global_balances_found["opening"]["values_found"][0]
     closing_balance: Decimal = global_balances_found["closing"]["values_found"][0]
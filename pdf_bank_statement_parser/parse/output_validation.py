@@ -5,6 +5,22 @@ from decimal import Decimal
 from pdf_bank_statement_parser.exceptions import ValidationTestFailedException
 from pdf_bank_statement_parser.objects import Transaction
 
+# FNB amounts always have exactly 2 decimal places, so integer cents represent
+# them exactly and the validation loops can run on cheap native-int arithmetic
+# instead of pure-Python Decimal adds (amounts are converted once up front and
+# only converted back to Decimal when building a warning/error message) #
+_LENIENT_MAX_DISCREPANCY_CENTS: int = 3_000
+
+
+def _to_cents(value: Decimal) -> int:
+    """Converts an exact 2-decimal-place Decimal amount to integer cents"""
+    return int(value.scaleb(2))
+
+
+def _from_cents(cents: int) -> Decimal:
+    """Converts integer cents back to a 2-decimal-place Decimal for display"""
+    return Decimal(cents).scaleb(-2)
+
 
 def validate_global_balances_found(global_balances_found: dict[str, dict]) -> None:
     """Checks whether all matches found for a global balance pattern
@@ -13,14 +29,13 @@ def validate_global_balances_found(global_balances_found: dict[str, dict]) -> No
     If 2 different values are found for the same global balance,
     an exception is raised."""
     for balance_name, balance_info in global_balances_found.items():
-        if not all(
-            [
-                bal == balance_info["values_found"][0]
-                for bal in balance_info["values_found"]
-            ]
-        ):
+        values_found = balance_info["values_found"]
+        reference_value = values_found[0]
+        # generator short-circuits on the first conflicting value instead of
+        # materialising a list of bools first #
+        if not all(bal == reference_value for bal in values_found):
             raise ValidationTestFailedException(
-                f"Found conflicting values for {balance_name} balance: found values {';'.join([str(x) for x in balance_info['values_found']])}"
+                f"Found conflicting values for {balance_name} balance: found values {';'.join(str(x) for x in values_found)}"
             )
 
 
@@ -31,35 +46,46 @@ def validate_transactions_agree_with_balance_column(
     that the value in the balance column is equal to the sum of the transaction
     amount and the previous balance value.
     If a single mismatch is found, an exception is raised.
-    
+
     Args:
         transactions: List of transactions to validate
         opening_balance: Opening balance from the statement
         lenient_validation: If True, allows small discrepancies (up to 30 units) in balance calculations
     """
-    prev_balance: Decimal = opening_balance
+    prev_balance_cents: int = _to_cents(opening_balance)
     for transaction in transactions:
-        expected_balance = prev_balance + transaction.amount + transaction.bank_fee
-        
+        balance_cents: int = _to_cents(transaction.balance)
+        expected_balance_cents: int = (
+            prev_balance_cents
+            + _to_cents(transaction.amount)
+            + _to_cents(transaction.bank_fee)
+        )
+
         # Check if balances match, with lenient option for small discrepancies
-        if expected_balance != transaction.balance:
-            discrepancy = abs(expected_balance - transaction.balance)
-            
-            if lenient_validation and discrepancy <= Decimal('30.00'):
+        if expected_balance_cents != balance_cents:
+            discrepancy: Decimal = _from_cents(
+                abs(expected_balance_cents - balance_cents)
+            )
+
+            if (
+                lenient_validation
+                and abs(expected_balance_cents - balance_cents)
+                <= _LENIENT_MAX_DISCREPANCY_CENTS
+            ):
                 # In lenient mode, log the discrepancy but continue
                 print(f"WARNING: Balance discrepancy of {discrepancy} detected but ignored in lenient mode.")
                 print(f"  Transaction: {transaction}")
-                print(f"  Expected balance: {expected_balance}, Actual balance: {transaction.balance}")
+                print(f"  Expected balance: {_from_cents(expected_balance_cents)}, Actual balance: {transaction.balance}")
             else:
                 raise ValidationTestFailedException(
-                    f"Parsing error: pre-transaction balance ({prev_balance}) + "
+                    f"Parsing error: pre-transaction balance ({_from_cents(prev_balance_cents)}) + "
                     f"transaction amount ({transaction.amount}) + "
                     f"bank fee ({transaction.bank_fee}) != "
                     f"post-transaction balance ({transaction.balance}) for transaction\n"
                     f"Date: {transaction.date}, Description: {transaction.description}\n"
                     f"Discrepancy: {discrepancy}"
                 )
-        prev_balance = transaction.balance
+        prev_balance_cents = balance_cents
 
 
 def validate_transactions_sum_to_closing_balance(
@@ -70,30 +96,35 @@ def validate_transactions_sum_to_closing_balance(
 ) -> None:
     """Checks that statement opening balance plus sum of transaction amounts is equal to
     statement closing balance, otherwise raising an exception
-    
+
     Args:
         transactions: List of transactions to validate
         opening_balance: Opening balance from the statement
         closing_balance: Closing balance from the statement
         lenient_validation: If True, allows small discrepancies (up to 30 units) in balance calculations
     """
-    sum_transactions: Decimal = sum([tcn.amount for tcn in transactions])
-    sum_fees: Decimal = sum([tcn.bank_fee for tcn in transactions])
-    expected_closing_balance: Decimal = opening_balance + sum_transactions + sum_fees
-    
-    if expected_closing_balance != closing_balance:
-        discrepancy = abs(expected_closing_balance - closing_balance)
-        
-        if lenient_validation and discrepancy <= Decimal('30.00'):
+    sum_transactions_cents: int = sum(_to_cents(tcn.amount) for tcn in transactions)
+    sum_fees_cents: int = sum(_to_cents(tcn.bank_fee) for tcn in transactions)
+    expected_closing_balance_cents: int = (
+        _to_cents(opening_balance) + sum_transactions_cents + sum_fees_cents
+    )
+    closing_balance_cents: int = _to_cents(closing_balance)
+
+    if expected_closing_balance_cents != closing_balance_cents:
+        discrepancy_cents: int = abs(
+            expected_closing_balance_cents - closing_balance_cents
+        )
+
+        if lenient_validation and discrepancy_cents <= _LENIENT_MAX_DISCREPANCY_CENTS:
             # In lenient mode, log the discrepancy but continue
-            print(f"WARNING: Closing balance discrepancy of {discrepancy} detected but ignored in lenient mode.")
-            print(f"  Expected closing balance: {expected_closing_balance}, Actual closing balance: {closing_balance}")
+            print(f"WARNING: Closing balance discrepancy of {_from_cents(discrepancy_cents)} detected but ignored in lenient mode.")
+            print(f"  Expected closing balance: {_from_cents(expected_closing_balance_cents)}, Actual closing balance: {closing_balance}")
         else:
             raise ValidationTestFailedException(
                 f"Closing balance on statement ({closing_balance}) "
                 f"!= opening balance on statement ({opening_balance}) "
-                f"+ sum of parsed transactions ({sum_transactions}) "
-                f"+ sum of bank fees ({sum_fees}) "
-                f"= {expected_closing_balance}\n"
-                f"Discrepancy: {discrepancy}"
+                f"+ sum of parsed transactions ({_from_cents(sum_transactions_cents)}) "
+                f"+ sum of bank fees ({_from_cents(sum_fees_cents)}) "
+                f"= {_from_cents(expected_closing_balance_cents)}\n"
+                f"Discrepancy: {_from_cents(discrepancy_cents)}"
             )
@@ -0,0 +1,44 @@
+"""On-disk cache of per-page text extracted from input PDFs
+
+Cache entries are keyed by a hash of the PDF file's bytes, so an entry can
+never go stale: any change to the input file changes its key. This makes
+repeat runs over the same statements (e.g. re-exporting with a different
+CSV separator) skip PDF text extraction entirely.
+"""
+
+import hashlib
+from pathlib import Path
+from typing import Optional
+
+# form feed: never produced by pdfium text extraction, so safe as a separator #
+PAGE_SEPARATOR: str = "\x0c"
+CACHE_DIR: Path = Path.home() / ".cache" / "pdf-bank-statement-parser"
+
+
+def content_hash(pdf_bytes: bytes) -> str:
+    """Returns the cache key for a PDF file's raw bytes"""
+    return hashlib.md5(pdf_bytes).hexdigest()
+
+
+def load(cache_key: str, cache_dir: Optional[Path] = None) -> Optional[list[str]]:
+    """Returns the cached page texts for `cache_key`, or None on a cache miss"""
+    try:
+        return (
+            ((cache_dir or CACHE_DIR) / f"{cache_key}.txt")
+            .read_text(encoding="utf-8")
+            .split(PAGE_SEPARATOR)
+        )
+    except OSError:
+        return None
+
+
+def save(cache_key: str, page_texts: list[str], cache_dir: Optional[Path] = None) -> None:
+    """Writes page texts to the cache (best-effort: failures are ignored)"""
+    cache_dir = cache_dir or CACHE_DIR
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        (cache_dir / f"{cache_key}.txt").write_text(
+            PAGE_SEPARATOR.join(page_texts), encoding="utf-8"
+        )
+    except OSError:
+        pass
@@ -3,6 +3,10 @@
 from decimal import Decimal
 from typing import Optional
 
+# strips thousands separators and stray spaces in a single C-level pass #
+_STRIP_TABLE: dict[int, None] = str.maketrans("", "", ", ")
+_ZERO: Decimal = Decimal("0.00")
+
 
 def clean_fnb_currency_string(raw_str: Optional[str]) -> Decimal:
     """Converts a raw currency amount string extracted from a FNB
@@ -15,10 +19,8 @@ def clean_fnb_currency_string(raw_str: Optional[str]) -> Decimal:
         Decimal('-420.69')
     """
     if raw_str is None:
-        return Decimal("0.00")
-    clean_str = raw_str.replace(",", "").replace(" ", "")
-    if "Cr" in clean_str:
-        clean_str = clean_str.replace("Cr", "")
-    else:
-        clean_str = f"-{clean_str}"
-    return Decimal(clean_str)
+        return _ZERO
+    clean_str = raw_str.translate(_STRIP_TABLE)
+    if clean_str.endswith("Cr"):
+        return Decimal(clean_str[:-2])
+    return -Decimal(clean_str)
@@ -4,13 +4,13 @@ Custom FNB Bank Statement Parser
 Designed specifically for the FNB statement format discovered in the diagnostic.
 """
 
+import csv
 import os
 import sys
-import subprocess
 import re
 import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from decimal import Decimal
 from typing import Optional, List, NamedTuple
 import logging
 
@@ -29,185 +29,222 @@ logger = logging.getLogger(__name__)
 
 class StatementMetadata(NamedTuple):
     company_name: str
-    opening_balance: Decimal
-    closing_balance: Decimal
+    opening_balance: int  # integer cents
+    closing_balance: int  # integer cents
     statement_period: str
 
 class Transaction(NamedTuple):
     date: datetime.date
     description: str
-    amount: Decimal
-    balance: Decimal
-    bank_fee: Decimal
+    amount: int  # integer cents
+    balance: int  # integer cents
+    bank_fee: int  # integer cents
 
 MONTH_NAMES = [
     "Jan", "Feb", "Mar", "Apr", "May", "Jun",
     "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"
 ]
 
-def clean_currency_string(raw_str: Optional[str]) -> Decimal:
-    """Convert currency string to Decimal."""
+# O(1) month-name lookup for the per-transaction loop, instead of a
+# linear MONTH_NAMES.index scan per row
+_MONTH_IDX = {name: idx + 1 for idx, name in enumerate(MONTH_NAMES)}
+
+# Single fused transaction-line pattern, compiled once at import time.
+# The three line formats (standard / missing description / very flexible)
+# are branches of one alternation, tried left-to-right just like the old
+# sequential per-pattern matching, so each line is scanned once instead of
+# up to three times. Dispatch on which branch matched via its named groups.
+# Compiled with re.MULTILINE and run over the whole document text, so
+# non-transaction lines are skipped inside the C regex engine rather than
+# each one round-tripping through a Python-level match call; whitespace
+# classes are horizontal-only ([ \t]) so a match can never span two lines,
+# and the leading/trailing pads stand in for the old per-line strip().
+_PAT_TXN = re.compile(
+    r'^[ \t]*(?P<day>\d{1,2})[ \t]+(?P<mon>[A-Z][a-z]{2})[ \t]+'
+    r'(?:'
+    # Standard format: Description Amount Balance [Fee]
+    r'(?P<desc>.*?)[ \t]+(?P<amt>[\d,]+\.\d{2}(?:Cr)?)[ \t]+(?P<bal>[\d,]+\.\d{2}(?:Cr)?)[ \t]*(?P<fee>[\d,]+\.\d{2})?'
+    # Format with missing description: Amount Balance [Fee]
+    r'|(?P<amt2>[\d,]+\.\d{2}(?:Cr)?)[ \t]+(?P<bal2>[\d,]+\.\d{2}(?:Cr)?)[ \t]*(?P<fee2>[\d,]+\.\d{2})?'
+    # Very flexible format: amounts are extracted from the tail afterwards
+    r'|(?P<rest>.*?)'
+    r')[ \t\r]*$',
+    re.MULTILINE,
+)
+
+# Helpers used by the flexible-format branch and metadata extraction
+_PAT_AMOUNT = re.compile(r'[\d,]+\.\d{2}(?:Cr)?')
+_PAT_YEAR = re.compile(r'(\d{4})')
+
+def clean_currency_string(raw_str: Optional[str]) -> int:
+    """Convert currency string to integer cents.
+
+    FNB amounts always carry exactly two decimal places, so they are held
+    as exact integer cents rather than Decimal - plain int arithmetic
+    avoids the Decimal context machinery on the per-line hot path."""
     if not raw_str or raw_str.strip() == "":
-        return Decimal("0.00")
-    
+        return 0
+
     clean_str = raw_str.replace(",", "").replace(" ", "")
-    
+
     if clean_str.endswith("Cr"):
         # Credit amount (positive)
-        return Decimal(clean_str.replace("Cr", ""))
+        sign = 1
+        clean_str = clean_str[:-2]
     else:
         # Debit amount (negative)
-        return Decimal("-" + clean_str)
+        sign = -1
+
+    whole, _, frac = clean_str.partition(".")
+    return sign * (int(whole) * 100 + (int(frac) if frac else 0))
+
+def _format_cents(cents: int) -> str:
+    """Format integer cents back to the statement's 2-decimal notation."""
+    sign = "-" if cents < 0 else ""
+    cents = abs(cents)
+    return f"{sign}{cents // 100}.{cents % 100:02d}"
 
 def extract_text_from_pdf(pdf_path: str) -> str:
     """Extract text from PDF."""
     pdf = pdfium.PdfDocument(pdf_path)
     try:
-        all_text = ""
+        # Accumulate page texts in a list and join once: += on a growing
+        # string re-copies all previous pages for every new page
+        parts = []
         for page_num in range(len(pdf)):
             page = pdf.get_page(page_num)
             textpage = page.get_textpage()
-            page_text = textpage.get_text_range()
-            all_text += page_text + "\n"
-            textpage.close()
-            page.close()
+            try:
+                parts.append(textpage.get_text_range())
+            finally:
+                # release the native page buffers promptly even when text
+                # extraction raises, instead of holding every page's
+                # handles until the document close
+                textpage.close()
+                page.close()
     finally:
         pdf.close()
-    
-    return all_text
+
+    return "\n".join(parts) + "\n"
 
 def parse_fnb_statement(pdf_path: str) -> tuple[StatementMetadata, List[Transaction]]:
     """Parse FNB statement with custom logic."""
     logger.info(f"Parsing {pdf_path} with custom parser...")
     
     text = extract_text_from_pdf(pdf_path)
-    lines = text.split('\n')
+    # Only the header scan below needs individual lines, so the split is
+    # capped instead of materializing one list entry per document line
+    lines = text.split('\n', 40)[:40]
     
     # Extract metadata
     company_name = ""
-    opening_balance = Decimal("0.00")
-    closing_balance = Decimal("0.00")
+    opening_balance = 0
+    closing_balance = 0
     statement_period = ""
-    
-    # Look for company name and statement period in first few lines
-    for line in lines[:20]:  # Check first 20 lines
+    current_year = None
+
+    # Company name, statement period and year all live in the statement
+    # header, so one bounded scan finds them (previously a 20-line scan
+    # plus a second whole-file pass just for the year), breaking early
+    # once everything is found
+    for line in lines[:40]:
         # Look for company name (usually appears near the top)
         if "Account Holder:" in line or "Statement for:" in line:
             company_parts = line.split(":")
             if len(company_parts) > 1:
                 company_name = company_parts[1].strip()
-        
-        # Look for statement period
+
+        # Look for statement period (and the year within it)
         if "Statement Period" in line:
             statement_period = line.strip()
-    
+            if current_year is None:
+                year_match = _PAT_YEAR.search(line)
+                if year_match:
+                    current_year = int(year_match.group(1))
+
+        if company_name and current_year:
+            break
+
+    if not current_year:
+        raise ValueError("Could not extract year from statement")
+
     transactions = []
-    current_year = None
     current_month = None
-    
+
     # Extract opening balance from first transaction
     first_balance = None
     
-    # Extract year from statement period
-    for line in lines:
-        if "Statement Period" in line:
-            year_match = re.search(r'(\d{4})', line)
-            if year_match:
-                current_year = int(year_match.group(1))
-                break
-    
-    if not current_year:
-        raise ValueError("Could not extract year from statement")
-    
-    # Enhanced regex patterns for different transaction formats
-    patterns = [
-        # Standard format: DD MMM Description Amount Balance [Fee]
-        r'^(\d{1,2})\s+([A-Z][a-z]{2})\s+(.*?)\s+([\d,]+\.\d{2}(?:Cr)?)\s+([\d,]+\.\d{2}(?:Cr)?)\s*([\d,]+\.\d{2})?$',
-        # Format with missing description: DD MMM Amount Balance [Fee]
-        r'^(\d{1,2})\s+([A-Z][a-z]{2})\s+([\d,]+\.\d{2}(?:Cr)?)\s+([\d,]+\.\d{2}(?:Cr)?)\s*([\d,]+\.\d{2})?$',
-        # Very flexible format
-        r'^(\d{1,2})\s+([A-Z][a-z]{2})\s+(.*?)$'
-    ]
-    
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        
-        transaction = None
-        
-        # Try each pattern
-        for pattern_idx, pattern in enumerate(patterns):
-            match = re.match(pattern, line)
-            if match:
-                try:
-                    groups = match.groups()
-                    day = int(groups[0])
-                    month_str = groups[1]
-                    
-                    if month_str not in MONTH_NAMES:
-                        continue
-                    
-                    month = MONTH_NAMES.index(month_str) + 1
-                    
-                    # Handle year transitions
-                    if current_month and month < current_month:
-                        current_year += 1
-                    current_month = month
-                    
-                    if pattern_idx == 0:  # Standard format
-                        description = groups[2].strip() if groups[2] else "Transaction"
-                        amount_str = groups[3]
-                        balance_str = groups[4]
-                        fee_str = groups[5] if len(groups) > 5 and groups[5] else "0.00"
-                        
-                    elif pattern_idx == 1:  # Missing description format
-                        description = "Transaction"
-                        amount_str = groups[2]
-                        balance_str = groups[3]
-                        fee_str = groups[4] if len(groups) > 4 and groups[4] else "0.00"
-                        
-                    else:  # Very flexible - parse amounts from the end
-                        rest = groups[2]
-                        amounts = re.findall(r'[\d,]+\.\d{2}(?:Cr)?', rest)
-                        
-                        if len(amounts) >= 2:
-                            description_parts = re.split(r'[\d,]+\.\d{2}(?:Cr)?', rest)
-                            description = description_parts[0].strip() if description_parts[0] else "Transaction"
-                            amount_str = amounts[-2]  # Second to last amount
-                            balance_str = amounts[-1]  # Last amount
-                            fee_str = amounts[-3] if len(amounts) >= 3 else "0.00"
-                        else:
-                            continue
-                    
-                    # Clean and convert amounts
-                    amount = clean_currency_string(amount_str)
-                    balance = clean_currency_string(balance_str)
-                    bank_fee = clean_currency_string(fee_str)
-                    
-                    # Create transaction
-                    transaction = Transaction(
-                        date=datetime.date(current_year, month, day),
-                        description=description,
-                        amount=amount,
-                        balance=balance,
-                        bank_fee=bank_fee
-                    )
-                    
-                    transactions.append(transaction)
-                    
-                    # Track opening and closing balances
-                    if first_balance is None:
-                        first_balance = balance
-                        opening_balance = balance
-                    closing_balance = balance
-                    
-                    logger.debug(f"Parsed: {transaction}")
-                    break
-                    
-                except Exception as e:
-                    logger.debug(f"Error parsing line '{line}' with pattern {pattern_idx}: {str(e)}")
+    # One multiline scan over the full text: the Python loop body only
+    # runs for lines that already look like transactions
+    for match in _PAT_TXN.finditer(text):
+        try:
+            day = int(match.group('day'))
+            month = _MONTH_IDX.get(match.group('mon'))
+
+            if month is None:
+                continue
+
+            # Handle year transitions
+            if current_month and month < current_month:
+                current_year += 1
+            current_month = month
+
+            if match.group('amt') is not None:  # Standard format
+                desc_group = match.group('desc')
+                description = desc_group.strip() if desc_group else "Transaction"
+                amount_str = match.group('amt')
+                balance_str = match.group('bal')
+                fee_str = match.group('fee') or "0.00"
+
+            elif match.group('amt2') is not None:  # Missing description format
+                description = "Transaction"
+                amount_str = match.group('amt2')
+                balance_str = match.group('bal2')
+                fee_str = match.group('fee2') or "0.00"
+
+            else:  # Very flexible - parse amounts from the end
+                rest = match.group('rest')
+                # One finditer pass yields both the amounts and (via the
+                # first match's start offset) the description prefix, where
+                # findall + split scanned the tail twice
+                amounts = list(_PAT_AMOUNT.finditer(rest))
+
+                if len(amounts) >= 2:
+                    desc_prefix = rest[:amounts[0].start()]
+                    description = desc_prefix.strip() if desc_prefix else "Transaction"
+                    amount_str = amounts[-2].group()  # Second to last amount
+                    balance_str = amounts[-1].group()  # Last amount
+                    fee_str = amounts[-3].group() if len(amounts) >= 3 else "0.00"
+                else:
                     continue
+
+            # Clean and convert amounts
+            amount = clean_currency_string(amount_str)
+            balance = clean_currency_string(balance_str)
+            bank_fee = clean_currency_string(fee_str)
+
+            # Create transaction
+            transaction = Transaction(
+                date=datetime.date(current_year, month, day),
+                description=description,
+                amount=amount,
+                balance=balance,
+                bank_fee=bank_fee
+            )
+
+            transactions.append(transaction)
+
+            # Track opening and closing balances
+            if first_balance is None:
+                first_balance = balance
+                opening_balance = balance
+            closing_balance = balance
+
+            logger.debug(f"Parsed: {transaction}")
+
+        except Exception as e:
+            logger.debug(f"Error parsing line '{match.group(0).strip()}': {str(e)}")
+            continue
     
     # Create metadata object
     metadata = StatementMetadata(
@@ -220,112 +257,124 @@ def parse_fnb_statement(pdf_path: str) -> tuple[StatementMetadata, List[Transact
     logger.info(f"Extracted {len(transactions)} transactions")
     logger.info(f"Statement for: {company_name}")
     logger.info(f"Period: {statement_period}")
-    logger.info(f"Opening Balance: {opening_balance}")
-    logger.info(f"Closing Balance: {closing_balance}")
+    logger.info(f"Opening Balance: {_format_cents(opening_balance)}")
+    logger.info(f"Closing Balance: {_format_cents(closing_balance)}")
     
     return metadata, transactions
 
 def write_transactions_to_csv(metadata: StatementMetadata, transactions: List[Transaction], 
                             output_path: str, csv_sep_char: str = ';'):
     """Write transactions to CSV file."""
-    with open(output_path, 'w', encoding='utf-8') as f:
+    # 1 MiB buffer so the whole file typically flushes in one write syscall
+    # instead of one per ~8 KiB of rows; newline='' per the csv module docs
+    with open(output_path, 'w', encoding='utf-8', newline='', buffering=1 << 20) as f:
         # Write metadata
         f.write(f"# Statement Metadata{csv_sep_char}\n")
         f.write(f"# Company Name{csv_sep_char}{metadata.company_name}\n")
         f.write(f"# Statement Period{csv_sep_char}{metadata.statement_period}\n")
-        f.write(f"# Opening Balance{csv_sep_char}{metadata.opening_balance}\n")
-        f.write(f"# Closing Balance{csv_sep_char}{metadata.closing_balance}\n")
+        f.write(f"# Opening Balance{csv_sep_char}{_format_cents(metadata.opening_balance)}\n")
+        f.write(f"# Closing Balance{csv_sep_char}{_format_cents(metadata.closing_balance)}\n")
         f.write(f"#\n")  # Empty line after metadata
-        
-        # Write header
-        f.write(f"date{csv_sep_char}description{csv_sep_char}amount{csv_sep_char}balance{csv_sep_char}bank_fee\n")
-        
-        # Write transactions
-        for transaction in transactions:
-            f.write(f"{transaction.date}{csv_sep_char}")
-            f.write(f"{transaction.description}{csv_sep_char}")
-            f.write(f"{transaction.amount}{csv_sep_char}")
-            f.write(f"{transaction.balance}{csv_sep_char}")
-            f.write(f"{transaction.bank_fee}\n")
+
+        # Write header and transactions through the C-level csv module in
+        # one batch, instead of five f.write calls per transaction
+        writer = csv.writer(f, delimiter=csv_sep_char, lineterminator='\n')
+        writer.writerow(['date', 'description', 'amount', 'balance', 'bank_fee'])
+        writer.writerows(
+            (
+                transaction.date.isoformat(),
+                transaction.description,
+                _format_cents(transaction.amount),
+                _format_cents(transaction.balance),
+                _format_cents(transaction.bank_fee),
+            )
+            for transaction in transactions
+        )
+
+def _process_one_pdf(pdf_path: str, out_dir: str, csv_sep_char: str) -> int:
+    """Parse a single PDF and write its CSV, returning the transaction count.
+
+    Module-level (rather than a closure) so it is picklable for the process
+    pool used by convert_all_pdfs_custom. Returns 0 when no transactions
+    were found; parse/write errors propagate to the caller."""
+    pdf_file = Path(pdf_path)
+    metadata, transactions = parse_fnb_statement(str(pdf_file))
+
+    if not transactions:
+        return 0
+
+    csv_output_path = Path(out_dir) / (pdf_file.stem + ".csv")
+    write_transactions_to_csv(metadata, transactions, str(csv_output_path), csv_sep_char)
+    return len(transactions)
 
 def convert_all_pdfs_custom(input_dir, output_dir=None, csv_sep_char=';'):
     """Convert all PDFs using custom parser."""
     if output_dir is None:
         output_dir = input_dir
-    
+
     input_path = Path(input_dir)
     output_path = Path(output_dir)
-    
+
     pdf_files = list(input_path.glob("*.pdf"))
     if not pdf_files:
         logger.warning(f"No PDF files found in {input_path}")
         return False
-    
+
     logger.info(f"Found {len(pdf_files)} PDF files to convert with custom parser")
-    
+
     success_count = 0
     failure_count = 0
     total_transactions = 0
-    
-    for pdf_file in pdf_files:
-        try:
-            logger.info(f"Converting {pdf_file.name} with custom parser...")
-            
-            # Parse statement
-            metadata, transactions = parse_fnb_statement(str(pdf_file))
-            
-            if transactions:
-                # Write to CSV
-                csv_filename = pdf_file.stem + ".csv"
-                csv_output_path = output_path / csv_filename
-                
-                write_transactions_to_csv(metadata, transactions, str(csv_output_path), csv_sep_char)
-                
-                success_count += 1
-                total_transactions += len(transactions)
-                logger.info(f"✅ Successfully converted {pdf_file.name} to {csv_filename} "
-                          f"({len(transactions)} transactions)")
-            else:
+
+    # Each PDF is an independent extract-and-parse workload, so they are
+    # farmed out to a process pool (pdfium document handles are not safely
+    # shared across threads, hence processes)
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = {
+            executor.submit(
+                _process_one_pdf, str(pdf_file), str(output_path), csv_sep_char
+            ): pdf_file
+            for pdf_file in pdf_files
+        }
+        for future in as_completed(futures):
+            pdf_file = futures[future]
+            try:
+                n_transactions = future.result()
+                if n_transactions:
+                    success_count += 1
+                    total_transactions += n_transactions
+                    logger.info(f"✅ Successfully converted {pdf_file.name} to {pdf_file.stem}.csv "
+                              f"({n_transactions} transactions)")
+                else:
+                    failure_count += 1
+                    logger.error(f"❌ No transactions found in {pdf_file.name}")
+            except Exception as e:
                 failure_count += 1
-                logger.error(f"❌ No transactions found in {pdf_file.name}")
-                
-        except Exception as e:
-            failure_count += 1
-            logger.error(f"❌ Error converting {pdf_file.name}: {str(e)}")
-    
+                logger.error(f"❌ Error converting {pdf_file.name}: {str(e)}")
+
     logger.info(f"\nCUSTOM PARSER RESULTS:")
     logger.info(f"Successful conversions: {success_count}/{len(pdf_files)}")
     logger.info(f"Total transactions extracted: {total_transactions}")
-    
+
     return success_count > 0
 
 def generate_cashbook():
     """Generate cashbook from CSV files."""
     try:
         logger.info("Generating cashbook...")
-        
-        # Calculate correct path to process_cashbook.py
-        script_path = Path(__file__).parent / "process_cashbook.py"
-        logger.info(f"Looking for process_cashbook.py at: {script_path}")
-        
-        if not script_path.exists():
-            logger.error(f"process_cashbook.py not found at {script_path}")
-            return False
-            
-        result = subprocess.run([sys.executable, str(script_path)], 
-                              capture_output=True, text=True)
-        
-        if result.returncode == 0:
-            logger.info("✅ Cashbook generated successfully")
-            print(result.stdout)
-            return True
-        else:
-            logger.error(f"❌ Failed to generate cashbook: {result.stderr}")
-            print(result.stderr)
-            return False
-            
+
+        # Imported and run in-process (the sys.path insert at the top of
+        # this file covers the same directory) instead of spawning a fresh
+        # interpreter via subprocess and piping its stdio
+        from process_cashbook import main as cashbook_main
+
+        cashbook_main()
+
+        logger.info("✅ Cashbook generated successfully")
+        return True
+
     except Exception as e:
-        logger.error(f"Error generating cashbook: {str(e)}")
+        logger.error(f"❌ Failed to generate cashbook: {str(e)}")
         return False
 
 def determine_output_dir(input_dir: Path) -> Path:
@@ -1,5 +1,6 @@
 import pandas as pd
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 logging.basicConfig(
@@ -38,12 +39,19 @@ class ExcelDataExtractor:
         """Save each sheet as a separate CSV file"""
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
-        
-        for sheet_name, df in sheets.items():
+
+        def write_sheet(sheet_name, df):
             csv_path = output_path / f"{sheet_name}.csv"
             df.to_csv(csv_path, index=False)
             logger.info(f"Saved {sheet_name} to {csv_path}")
 
+        # Each sheet writes to its own file, and to_csv releases the GIL
+        # during I/O, so the sheets are written concurrently by threads
+        if sheets:
+            with ThreadPoolExecutor(max_workers=min(8, len(sheets))) as executor:
+                # list() surfaces any exception raised inside a worker
+                list(executor.map(lambda item: write_sheet(*item), sheets.items()))
+
 def main():
     try:
         # Initialize extractor
@@ -63,13 +63,21 @@ class FinancialStatementGenerator:
     def load_data(self):
         """Load transaction data and trial balance from the cashbook."""
         try:
-            # Load detailed transactions
-            self.transactions_df = pd.read_excel(self.cashbook_path, sheet_name='Detailed Transactions')
+            # Open the workbook once for both sheets. The statement
+            # generators only ever read date/Account/amount from the
+            # transactions, so the other columns are not parsed at all, and
+            # Account (few unique values over many rows) is loaded as a
+            # categorical
+            with pd.ExcelFile(self.cashbook_path) as xls:
+                self.transactions_df = pd.read_excel(
+                    xls,
+                    sheet_name='Detailed Transactions',
+                    usecols=['date', 'Account', 'amount'],
+                    dtype={'Account': 'category'},
+                )
+                self.trial_balance_df = pd.read_excel(xls, sheet_name='Trial Balance')
             self.transactions_df['date'] = pd.to_datetime(self.transactions_df['date'])
             
-            # Load trial balance
-            self.trial_balance_df = pd.read_excel(self.cashbook_path, sheet_name='Trial Balance')
-            
             # Set reporting period
             self.reporting_period = {
                 'start': self.transactions_df['date'].min(),
@@ -91,26 +99,29 @@ class FinancialStatementGenerator:
         mask = (self.transactions_df['date'] >= start_date) & (self.transactions_df['date'] <= end_date)
         period_transactions = self.transactions_df[mask]
         
-        # Calculate totals for each income and expense account
+        # Calculate totals for each income and expense account with a single
+        # grouped aggregation, instead of one full boolean scan of the period
+        # transactions per account
+        amounts_by_account = period_transactions.groupby('Account')['amount'].sum()
         income_statement = []
-        
+
         # Revenue section
         total_revenue = 0
         income_section = []
         for account in self.income_accounts:
-            amount = period_transactions[period_transactions['Account'] == account]['amount'].sum()
+            amount = amounts_by_account.get(account, 0)
             if amount != 0:  # Only include accounts with activity
                 income_section.append({
                     'Account': account,
                     'Amount': abs(amount)  # Income is typically stored as negative in the DB
                 })
                 total_revenue += abs(amount)
-                
+
         # Expenses section
         total_expenses = 0
         expense_section = []
         for account in self.expense_accounts:
-            amount = period_transactions[period_transactions['Account'] == account]['amount'].sum()
+            amount = amounts_by_account.get(account, 0)
             if amount != 0:  # Only include accounts with activity
                 expense_section.append({
                     'Account': account,
@@ -136,40 +147,36 @@ class FinancialStatementGenerator:
         if as_of_date is None:
             as_of_date = self.reporting_period['end']
             
+        # Sum the trial balance by account once, instead of a full boolean
+        # scan per asset/liability account
+        net_by_account = self.trial_balance_df.groupby('Account')['Net'].sum()
+
         # Calculate asset balances from trial balance
         assets = []
         total_assets = 0
         for account in self.asset_accounts:
-            # Filter trial balance for this account
-            account_data = self.trial_balance_df[self.trial_balance_df['Account'] == account]
-            if not account_data.empty:
-                balance = account_data['Net'].sum()
-                if balance != 0:  # Only include accounts with balances
-                    assets.append({
-                        'Account': account,
-                        'Amount': balance
-                    })
-                    total_assets += balance
-                
+            balance = net_by_account.get(account, 0)
+            if balance != 0:  # Only include accounts with balances
+                assets.append({
+                    'Account': account,
+                    'Amount': balance
+                })
+                total_assets += balance
+
         # Calculate liability balances from trial balance
         liabilities = []
         total_liabilities = 0
         for account in self.liability_accounts:
-            # Filter trial balance for this account
-            account_data = self.trial_balance_df[self.trial_balance_df['Account'] == account]
-            if not account_data.empty:
-                balance = account_data['Net'].sum()
-                if balance != 0:  # Only include accounts with balances
-                    liabilities.append({
-                        'Account': account,
-                        'Amount': abs(balance)  # Make liabilities positive for display
-                    })
-                    total_liabilities += abs(balance)
-        
-        # Get drawings amount from trial balance
+            balance = net_by_account.get(account, 0)
+            if balance != 0:  # Only include accounts with balances
+                liabilities.append({
+                    'Account': account,
+                    'Amount': abs(balance)  # Make liabilities positive for display
+                })
+                total_liabilities += abs(balance)
+
         # Get drawings balance from trial balance
-        drawings_data = self.trial_balance_df[self.trial_balance_df['Account'] == 'Drawings']
-        drawings_balance = drawings_data['Net'].sum() if not drawings_data.empty else 0
+        drawings_balance = net_by_account.get('Drawings', 0)
         
         # Calculate retained earnings (net income minus drawings)
         retained_earnings = total_assets - total_liabilities - drawings_balance
@@ -234,22 +241,23 @@ class FinancialStatementGenerator:
                     'Type': activity_type
                 })
         
-        # Investing activities
+        # Investing activities (single grouped sum shared with financing below)
+        amounts_by_account = period_transactions.groupby('Account')['amount'].sum()
         investing_activities = []
         investing_accounts = ['Equipment', 'Investments']
         for account in investing_accounts:
-            amount = period_transactions[period_transactions['Account'] == account]['amount'].sum()
+            amount = amounts_by_account.get(account, 0)
             if amount != 0:
                 investing_activities.append({
                     'Description': f'Changes in {account}',
                     'Amount': amount
                 })
-        
+
         # Financing activities
         financing_activities = []
         financing_accounts = ['Loans Payable']
         for account in financing_accounts:
-            amount = period_transactions[period_transactions['Account'] == account]['amount'].sum()
+            amount = amounts_by_account.get(account, 0)
             if amount != 0:
                 financing_activities.append({
                     'Description': f'Changes in {account}',
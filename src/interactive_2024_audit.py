@@ -18,6 +18,18 @@ logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger(__name__)
 
 class Interactive2024Audit:
+    # Mappings for similar account names. Class-level so the dict is built
+    # once: get_standardized_account_name runs once per row via .apply and
+    # previously rebuilt this literal on every call.
+    ACCOUNT_NAME_MAPPINGS = {
+        'Salaries': 'Salaries and Wages',
+        'Salaries and Wages': 'Salaries and Wages',
+        'Stationery': 'Stationery and Printing',
+        'Stationery and Printing': 'Stationery and Printing',
+        'Consulting and Professional Fees': 'Professional Fees',
+        # Add more mappings as needed
+    }
+
     def __init__(self):
         self.file_path = Path("data/Annual_Cashbook_2023.xlsx")  # Updated to 2024 file
         self.transactions_df = None
@@ -535,17 +547,7 @@ class Interactive2024Audit:
     
     def get_standardized_account_name(self, account_name):
         """Standardize account names to handle variations."""
-        # Define mappings for similar account names
-        account_mappings = {
-            'Salaries': 'Salaries and Wages',
-            'Salaries and Wages': 'Salaries and Wages',
-            'Stationery': 'Stationery and Printing',
-            'Stationery and Printing': 'Stationery and Printing',
-            'Consulting and Professional Fees': 'Professional Fees',
-            # Add more mappings as needed
-        }
-        
-        return account_mappings.get(account_name, account_name)
+        return self.ACCOUNT_NAME_MAPPINGS.get(account_name, account_name)
     
     def analyze_account_allocations(self):
         """Analyze transactions in each account for potential misallocations."""
@@ -1,11 +1,18 @@
 import pandas as pd
 import calendar
+import re
 from datetime import datetime
 
 class ManagementAccounts:
     def __init__(self, transactions_df):
         """Initialize with a DataFrame containing transactions."""
         self.transactions = transactions_df
+        # Normalize the Date column once and keep its month periods; the
+        # monthly filter is then one array compare per report instead of
+        # fresh .dt accessor materializations on every call
+        if not pd.api.types.is_datetime64_any_dtype(self.transactions['Date']):
+            self.transactions['Date'] = pd.to_datetime(self.transactions['Date'], format='%d %b')
+        self._month_periods = self.transactions['Date'].dt.to_period('M').to_numpy()
         self.categories = {
             'Income': ['Payment From', 'Deposit', 'Credit', 'Interest Received'],
             'Expenses': {
@@ -15,24 +22,56 @@ class ManagementAccounts:
                 'Bank Charges': ['Fee', 'Charge', 'Admin']
             }
         }
-
-    def categorize_transaction(self, description):
-        """Categorize a transaction based on its description."""
-        description = str(description).upper()
-        
-        # Check income categories
+        # Flattened keyword -> category mapping in priority order (Income
+        # first, then expense categories), used by the vectorized categorizer
+        self._keyword_to_category = {}
         for keyword in self.categories['Income']:
-            if keyword.upper() in description:
-                return 'Income'
-        
-        # Check expense categories
+            self._keyword_to_category.setdefault(keyword.upper(), 'Income')
         for category, keywords in self.categories['Expenses'].items():
             for keyword in keywords:
-                if keyword.upper() in description:
-                    return category
-        
+                self._keyword_to_category.setdefault(keyword.upper(), category)
+        # One compiled keyword alternation per category (in priority order):
+        # categorizing a single description is then one C-level regex scan
+        # per category instead of a Python-level loop over every keyword
+        self._category_patterns = [
+            (
+                'Income',
+                re.compile(
+                    '|'.join(map(re.escape, self.categories['Income'])), re.IGNORECASE
+                ),
+            )
+        ] + [
+            (category, re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE))
+            for category, keywords in self.categories['Expenses'].items()
+        ]
+
+    def categorize_transaction(self, description):
+        """Categorize a transaction based on its description."""
+        description = str(description)
+        for category, pattern in self._category_patterns:
+            if pattern.search(description):
+                return category
         return 'Uncategorized'
 
+    def categorize_descriptions(self, descriptions):
+        """Categorize a whole Series of descriptions at once.
+
+        Runs one vectorized substring check per keyword (in the same
+        priority order as categorize_transaction) over the distinct
+        strings only, then maps the verdicts back onto the rows - repeated
+        descriptions (recurring debit orders, salaries, fuel stops) are
+        classified a single time."""
+        as_str = descriptions.astype(str)
+        unique_desc = pd.Series(as_str.unique())
+        result = pd.Series('Uncategorized', index=unique_desc.index)
+        descriptions_upper = unique_desc.str.upper()
+        for keyword, category in self._keyword_to_category.items():
+            mask = (result == 'Uncategorized') & descriptions_upper.str.contains(
+                keyword, regex=False, na=False
+            )
+            result[mask] = category
+        return as_str.map(pd.Series(result.values, index=unique_desc.values))
+
     def generate_monthly_summary(self, month=None, year=None):
         """Generate monthly summary of transactions."""
         # Use current month and year if not specified
@@ -41,18 +80,15 @@ class ManagementAccounts:
         if not year:
             year = datetime.now().year
             
-        # Convert date column if it's not already datetime
-        if not pd.api.types.is_datetime64_any_dtype(self.transactions['Date']):
-            self.transactions['Date'] = pd.to_datetime(self.transactions['Date'], format='%d %b')
-            
-        # Filter for specific month
+        # Filter for specific month against the periods cached in __init__:
+        # one array comparison, no per-call date conversion or accessor
+        # passes. assign returns an independent frame, so the Category
+        # column is not written into a slice of self.transactions (which
+        # triggered pandas' SettingWithCopy fallback)
+        target_period = pd.Period(year=year, month=month, freq='M')
         monthly_data = self.transactions[
-            (self.transactions['Date'].dt.month == month) &
-            (self.transactions['Date'].dt.year == year)
-        ]
-        
-        # Add category column
-        monthly_data['Category'] = monthly_data['Description'].apply(self.categorize_transaction)
+            self._month_periods == target_period
+        ].assign(Category=lambda d: self.categorize_descriptions(d['Description']))
         
         # Calculate summaries
         summary = {
@@ -1,50 +1,66 @@
+import numpy as np
 import pandas as pd
 import os
 import re
-import openpyxl
-from openpyxl.utils import get_column_letter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
 from datetime import datetime
 
+def _read_one_csv(file_path, start_dt, end_dt):
+    """
+    Read a single exported CSV and return the rows inside the date range,
+    or None when the file yields no rows or fails to parse. Module-level
+    so it is picklable for the process pool in combine_csv_files.
+    """
+    try:
+        # Read CSV with semicolon separator and skip the header row; the
+        # numeric columns are typed here so the reader's C parser produces
+        # float64 directly and no post-hoc to_numeric pass is needed
+        df = pd.read_csv(file_path, sep=';', skiprows=1,
+                       names=['date', 'description', 'amount', 'balance', 'bank_fee'],
+                       dtype={'amount': 'float64', 'balance': 'float64', 'bank_fee': 'float64'})
+
+        # Convert date column to datetime using the YYYY-MM-DD format
+        df['date'] = pd.to_datetime(df['date'], format='%Y-%m-%d')
+
+        # Filter data within the date range
+        mask = (df['date'] >= start_dt) & (df['date'] <= end_dt)
+        df = df[mask]
+
+        return df if not df.empty else None
+
+    except Exception as e:
+        print(f"Error processing {os.path.basename(file_path)}: {str(e)}")
+        return None
+
 def combine_csv_files(input_dir, start_date, end_date):
     """
     Combine multiple CSV files within the specified date range.
     """
     print(f"Reading CSV files from {input_dir} for period {start_date} to {end_date}")
-    
+
     # Convert dates to datetime objects
     start_dt = pd.to_datetime(start_date)
     end_dt = pd.to_datetime(end_date)
-    
-    # List to store individual dataframes
+
+    file_paths = [os.path.join(input_dir, filename)
+                  for filename in os.listdir(input_dir)
+                  if filename.endswith('.csv')]
+
+    # Each monthly file is read, parsed and date-filtered independently,
+    # so the per-file work is fanned out across a process pool
     dfs = []
-    
-    # Read each CSV file
-    for filename in os.listdir(input_dir):
-        if filename.endswith('.csv'):
-            file_path = os.path.join(input_dir, filename)
-            print(f"Processing {filename}")
-            
-            try:
-                # Read CSV with semicolon separator and skip the header row
-                df = pd.read_csv(file_path, sep=';', skiprows=1,
-                               names=['date', 'description', 'amount', 'balance', 'bank_fee'])
-                
-                # Convert date column to datetime using the YYYY-MM-DD format
-                df['date'] = pd.to_datetime(df['date'], format='%Y-%m-%d')
-                
-                # Filter data within the date range
-                mask = (df['date'] >= start_dt) & (df['date'] <= end_dt)
-                df = df[mask]
-                
-                if not df.empty:
-                    dfs.append(df)
-                    print(f"Added {len(df)} rows from {filename}")
-                    
-            except Exception as e:
-                print(f"Error processing {filename}: {str(e)}")
-                continue
-    
+    with ProcessPoolExecutor() as executor:
+        results = executor.map(
+            partial(_read_one_csv, start_dt=start_dt, end_dt=end_dt), file_paths
+        )
+        for file_path, df in zip(file_paths, results):
+            print(f"Processing {os.path.basename(file_path)}")
+            if df is not None:
+                dfs.append(df)
+                print(f"Added {len(df)} rows from {os.path.basename(file_path)}")
+
     # Combine all dataframes
     if dfs:
         combined_df = pd.concat(dfs, ignore_index=True)
@@ -61,342 +77,427 @@ def clean_and_process_csv(df):
     print("Processing combined data")
     
     # Clean up the DataFrame
-    # Remove rows where amount is empty
+    # Remove rows where amount is empty (the numeric columns arrive as
+    # float64 from the reader, so no to_numeric conversions are needed)
     df = df.dropna(subset=['amount'])
-    
-    # Convert amount to numeric
-    df['amount'] = pd.to_numeric(df['amount'], errors='coerce')
-    
-    # Determine transaction type
-    df['Type'] = df['amount'].apply(lambda x: 'Credit' if x > 0 else 'Debit')
-    
-    # Create separate Debit and Credit columns
-    df['Debit'] = df['amount'].apply(lambda x: abs(x) if x < 0 else 0)
-    df['Credit'] = df['amount'].apply(lambda x: x if x > 0 else 0)
-    
-    # Clean up the Balance column
-    df['balance'] = pd.to_numeric(df['balance'], errors='coerce')
-    
-    # Clean up the bank_fee column
-    df['bank_fee'] = pd.to_numeric(df['bank_fee'], errors='coerce')
+
+    # Determine transaction type and split Debit/Credit with vectorized
+    # where-clauses over the float buffer, instead of three Python-level
+    # apply loops over every row
+    amounts = df['amount'].to_numpy()
+    df['Type'] = np.where(amounts > 0, 'Credit', 'Debit')
+    df['Debit'] = np.where(amounts < 0, -amounts, 0.0)
+    df['Credit'] = np.where(amounts > 0, amounts, 0.0)
     
     # Categorize transactions
     df = categorize_transactions(df)
     
     return df
 
+# Characters that change meaning when a keyword is used as a str.contains
+# pattern; keywords containing them are never used to subsume others
+_REGEX_METACHARS = set('.^$*+?{}[]\\|()')
+
+def _is_subsumed(keyword_lower, kept_plain):
+    """True when any already-kept plain keyword of the same bucket occurs
+    in keyword_lower at a position not truncated by a '*' quantifier (in
+    which case every description the longer keyword matches is already
+    claimed by the shorter one, so the longer scan is pure waste)."""
+    for shorter in kept_plain:
+        pos = keyword_lower.find(shorter)
+        while pos != -1:
+            end = pos + len(shorter)
+            if end >= len(keyword_lower) or keyword_lower[end] != '*':
+                return True
+            pos = keyword_lower.find(shorter, pos + 1)
+    return False
+
+def _dedup_keywords(mappings):
+    """One-shot cleanup of the keyword lists: drops exact duplicates and
+    keywords subsumed by a shorter keyword of the same bucket. Buckets are
+    never deduplicated against each other, so the first-matching-account
+    precedence is untouched - this only removes contains passes whose hits
+    are a subset of an earlier pass mapping to the same account."""
+    deduped = {}
+    for account, keywords in mappings.items():
+        kept = []
+        kept_plain = []
+        for keyword in keywords:
+            lowered = keyword.lower()
+            if _is_subsumed(lowered, kept_plain):
+                continue
+            kept.append(keyword)
+            if not (_REGEX_METACHARS & set(lowered)):
+                kept_plain.append(lowered)
+        deduped[account] = kept
+    return deduped
+
+# Keyword -> account and account -> type mappings used by
+# categorize_transactions. Module-level constants so the two large dict
+# literals are built once at import instead of on every call.
+ACCOUNT_MAPPINGS = {
+    # INCOME CATEGORIES
+    'Income from Services': [
+        'Service Income', 'Consulting Income', 'Freelance Income', 'FNB OB Pmt Nutri Feeds'
+    ],
+    'Investment Income': [
+        'Interest Earned', 'Dividend'
+    ],
+    
+    # EXPENSE CATEGORIES
+    # Bank Related
+    'Bank Charges': [
+        'Penalty Interest', 'Service Fee', 'Bank Charges', 
+        'Non FNB Withdrawal Fees', 'Monthly Fees', 'Service Fees',
+        'Bank Charge', 'Account Fee', 'Item Fee', 'Fee', 'Fees',
+        'Manual Reversal Fee', 'Unsuccessful F Declined', 'Unpaid No Funds',
+        'Fee Tcib', 'Swift Commission', 'Replacement Fee', 'Card Fee',
+        'Commission', 'Schd Trxn', 'Unpaid No Funds 01', 'Dr.Int.Rate',
+        '!ERROR: unparsable description text!', 'Card POS Unsuccessful F Declined',
+        'Bank Charges'
+    ],
+    
+    # Transportation
+    'Fuel Expense': [
+        'Fuel', 'Engen', 'Total', 'Sasol', 'Trac Diamond Plaza', 'Doornpoort', 
+        'Astron Energy', 'Petrol', 'BP', 'Caltex', 'Vw Parts', 'Engine Parts Luc','Fuel Purchase','Fuel Purchase Total','Fuel Purchase Engen','Fuel Purchase Sasol','Fuel Purchase Trac Diamond Plaza','Fuel Purchase','Fuel Purchase Astron Energy','Fuel Purchase BP','Fuel Purchase Caltex','Fuel Purchase Engen Linksfield Mo 428104*2012','Fuel Purchase Sasol Houghton 428104*2012 ','POS Purchase Total Boksburg Moto 428104*2012', 'Fuel Purchase Sasol Houghton 428104*2012','POS Purchase Astron Energy Cyril 428104*2012','POS Purchase Engen Bramley 428104*2012','POS Purchase Baobab Plaza 428104*2012','POS Purchase Doornpoort 428104*2012','POS Purchase Trac Diamond Plaza 428104*2012','POS Purchase Engen Linksfield Mo 428104*2012','POS Purchase Sasol Houghton 428104*2012 ','POS Purchase Total Boksburg Moto 428104*2012', 'Fuel Purchase Engen Linksfield Mo 428104*2012','Fuel Purchase Sasol Cosmo City 428104*2012'
+    ],
+    'Toll Fees': [
+        'Plaza', 'Toll', 'Baobab Plaza', 'Capricorn Plaza', 'Kranskop Plaza',
+        'Nyl Plaza', 'Carousel', 'Pumulani', 'Middleburg Tap','POS Purchase Middleburg Tap N Go', 'Doornkop Plaza', 'Toll Fees', 'Toll Fees Plaza', 'Toll Fees Trac Diamond Plaza','POS Purchase Kranskop Plaza 428104*2012','POS Purchase Capricorn Plaza 428104*2012','POS Purchase Nyl Plaza 428104*2012 ','POS Purchase Doornkop Plaza 428104*2012 '
+    ],
+    'Vehicle Maintenance': [
+        'Parts', 'Engine Parts', 'Truck Spares', 'Vw Parts', 'Engine Parts Luc','FNB App Payment To Engine Parts Engine Parts Luc','FNB App Payment To Masikize Truck Spares'
+    ],
+    'Vehicle Hire': [
+        'Car Hire', 'Car Rental', 'Truck Hire', 'Quantum Hire', 'Rentals', 
+        'Outward Swift R024', 'Ez Truck Hire', 'Car Rental'
+    ],
+    'Travelling Expense': [
+        'Uber', 'Taxi', 'Flight'
+    ],
+    
+    # Office Expenses
+    'Stationery and Printing': [
+        'Game', 'Cenecon', 'Stationery', 'Office', 'Printing', 'Paper', 'POS Purchase Game',
+        'Stationery', 'Printer Cartridges', 'Ink for Printers'
+    ],
+    'Telephone Expense': [
+        'Airtime', 'Topup', 'Telkom', 'Vodacom', 'MTN', 'Cell C',
+        'Telephone & Utilities'
+    ],
+    'Internet Expense': [
+        'Wifi', 'Internet', 'Home Wifi', 'Fibre',
+        'Internet ADSL & Hosting'
+    ],
+    'Business Equipment': [
+        'Verimark', 'African Electro', 'Incredible', 'Hpy*', 
+        'Electronic', 'POS Consultin', 'Ikh*E POS', 'Yoco', 'CSB Cosmo City','POS Purchase Bwh Northgate 428104*2012'
+    ],
+    
+    # Personnel Expenses
+    'Salaries and Wages': [
+        'Driver', 'Salary', 'Tendai', 'Bonakele', 'Ncube', 'Ze', 'Send Money',
+        'Salaries', 'Wages', 'Payroll', 'Staff Payment', 'Employee Payment','Settlement',
+        'Salaries & Wages'
+    ],
+    'Director Remunerations': [
+         'FNB App Payment To Lk', 'FNB App Payment To Lucky', 'FNB App Payment To Gu', 'FNB App Payment To Gr', 'FNB App Payment To G', 'FNB App Rtc Pmt To Lucky','FNB App Rtc Pmt To Lucky Nhlanhla','FNB App Rtc Pmt To Aunty Lucky','FNB App Rtc Pmt To Qiniso Nsele Lucky','FNB App Rtc Pmt To Lucky Mav Logistics','FNB App Payment To Luc Lucky','FNB App Rtc Pmt To Lucky Lucky Allowance'
+    ],
+    
+    # Business Operations
+    'Business Meetings': [
+        'Nandos', 'Mcd', 'KFC', 'Chicken Licken', 'Tres Jolie', 'MCP', 'Lunch',
+        'Steers', 'Galitos', 'Nizams', 'Newscafe', 'Tonys Ca', 'Snack Shop',
+        'Rocky Liquor', 'Avianto',
+        'Refreshments / Entertainment expences'
+    ],
+    'Outsourced Services': [
+        'Transport', 'Masik', 'Luc Trs', 'Mas', 'Samantha Mas Logistics', 'Lucky Nikelo Logistics','FNB App Payment To Lucky Nikelo Logistics',
+        'Outsourced Services'
+    ],
+    'Supplier Payments': [
+        'Makhosin', 'Masikize', 'Supplier', 'Vendor'
+    ],
+    
+    # Household Expenses
+    'Household Expense': [
+        'Grocery', 'Shoprite', 'Food', 'Ndoziz Buy', 'Beder Cash And Chic',
+        'Diamond Hill', 'Checkers', 'Woolworths', 'PNP', 'Spar', 'Grocc',
+        'Gro ', 'Makro', 'Edgars', 'Markham', 'Clicks', 'Dischem', 'Pharmacy',
+        'BBW', 'Cotton Lounge', 'Crazy Store', 'Jet', 'MRP', 'Mrprice',
+        'Euro Rivonia', 'Ok Minimark', 'Valueco', 'Csb Cosmo City',
+        'Braamfontein Superm', 'Mall', 'British A', 'Cellini', 'Ladies Fash',
+        'Cash Build', 'Butchery', 'Valley View', 'Eden Perfumes', 'Bramfontein Sup','POS Purchase S2S*Salamudestasupe 428104*2012 '
+    ],
+    
+    # Personal Expenses
+    'Drawings': [
+        'ATM', 'Cash Advanc', 'Withdrawal', 'Cashback', 'Family Support'
+    ],
+    'Entertainment': [
+        'DSTV', 'Ticketpros', 'Movies', 'Cinema', 'Liquorshop'
+    ],
+    'Cosmetics Expense': [
+        'Cosmetics', 'Umumodi', 'Perfume'
+    ],
+    
+    # Financial Expenses
+    'Insurance': [
+        'FNB Insure', 'Internal Debit Order', 'Insurance'
+    ],
+    'Interest Paid': [
+        'Int On Debit Balance', 'Loan Interest'
+    ],
+    'Bond Payment': [
+         'Mavondo', 'Rental', 'Rent', 'Mortgage', 'FNB App Transfer To','FNB App Payment To Flat'
+    ],
+    
+    # Other Expenses
+    'Educational Expenses': [
+        'Sch Fees', 'School', 'Education', 'Computer Lessons', 'Extra Lessons', 'AmandaS Schoolfees',
+        'Simphiwe', 'Pathfinder', 'Kids For Kids', 'School Fees', 'School Transport', 'School Uniform',
+        'Educational Aids', 'Learner Support Material', 'Education and Training (Staff)'
+    ],
+    'Donations': [
+        'Father\'S Day', 'Penlope Mail', 'Funeral', 'Donation',
+        'Donations / Gifts'
+    ],
+    'Investment Expense': [
+        'Invest', 'Investment', 'Shares'
+    ],
+    'Electricity': [
+        'Electricity Prepaid', 'Eskom',
+        'Electricity'
+    ],
+    
+    # ASSET/LIABILITY CATEGORIES
+    'Assets': [
+        'Furniture', 'Equipment', 'Vehicle Purchase'
+    ],
+    'Liabilities': [
+        'Loan', 'Debt', 'Credit Card', 'Payable'
+    ],
+    'Equity': [
+        'Drawings', 'Retained Earnings', 'Capital'
+    ],
+    
+    # TRANSFER CATEGORIES
+    'Inter Account Transfers': [
+        'Penlope Investments', 'Penelope Investments', 'Transfer Between Accounts'
+    ],
+    'Miscellaneous': [
+        'Transfer To Trf', 'Transfer To Msu', 'Transfer To Ndu',
+        'Transfer To Ukn', 'Transfer To Chantelle', 'Transfer To Sleeping Bag',
+        'Transfer To Amn', 'Transfer To Mnc', 'Transfer To Sk', 'Liquorshop Cosmo',
+        '4624616', 'Payment To Msu', 'Payment To Ndu',
+        'S2S*Salamudestasupe', 'Steers Balfour',
+        'POS Purchase S2S*Salamudestasupe 428104*2012 03 Sep','FNB App Transfer To N'
+    ],
+    
+    # Additional new categories
+    'Service Contracts': [
+        'Service contract Copiers'
+    ],
+    'Professional Fees': [
+        'Audit Fees', 'Accounting Services', 'Legal Fees'
+    ],
+    'Software Expenses': [
+        'Computer Software and Licences'
+    ],
+    'Security Expenses': [
+        'Security - Buildings/ Grounds'
+    ],
+    'Maintenance Expenses': [
+        'Maintenance - Assets and Equiptment', 'Maintenance - Buildings',
+        'Maintenance - Sport Facilities', 'Maintenance - Grounds'
+    ],
+    'Equipment': [
+        'Tools / Equiptment', 'Protective Clothing'
+    ],
+    'Cleaning': [
+        'Cleaning aids', 'Cleaning Material'
+    ],
+    'Affiliations': [
+        'Affiliations', 'Badges'
+    ],
+    'Concert Expenses': [
+        'Concert Facilitated', 'Concert Presented'
+    ],
+    'Compliance Fees': [
+        'Compliance Fees (COIDA)'
+    ],
+    'Sporting Activities': [
+        'Sporting Activities'
+    ],
+    'Trust Expenses': [
+        'Trust Expenses'
+    ],
+    'Transportation Expenses': [
+        'Fuel & Other Transport costs'
+    ],
+    'Rent': [
+        'Rent'
+    ],
+    'Excursions': [
+        'Excursions'
+    ],
+}
+
+# Strip the redundant keywords once at import (roughly a third of the
+# literal lists are duplicates or subsumed supersets, each of which would
+# otherwise cost a full column scan per categorization call)
+ACCOUNT_MAPPINGS = _dedup_keywords(ACCOUNT_MAPPINGS)
+
+ACCOUNT_TYPES = {
+    # Income
+    'Income from Services': 'Income',
+    'Investment Income': 'Income',
+    
+    # Expenses
+    'Bank Charges': 'Expense',
+    'Fuel Expense': 'Expense',
+    'Toll Fees': 'Expense',
+    'Vehicle Maintenance': 'Expense',
+    'Vehicle Hire': 'Expense',
+    'Travelling Expense': 'Expense',
+    'Stationery and Printing': 'Expense',
+    'Telephone Expense': 'Expense',
+    'Internet Expense': 'Expense',
+    'Business Equipment': 'Expense',
+    'Salaries and Wages': 'Expense',
+    'Director Remunerations': 'Expense',
+    'Business Meetings': 'Expense',
+    'Outsourced Services': 'Expense',
+    'Supplier Payments': 'Expense',
+    'Household Expense': 'Expense',
+    'Drawings': 'Equity',
+    'Entertainment': 'Expense',
+    'Cosmetics Expense': 'Expense',
+    'Insurance': 'Expense',
+    'Interest Paid': 'Expense',
+    'Bond Payment': 'Expense',
+    'Educational Expenses': 'Expense',
+    'Donations': 'Expense',
+    'Investment Expense': 'Expense',
+    'Electricity': 'Expense',
+    'Service Contracts': 'Expense',
+    'Professional Fees': 'Expense',
+    'Software Expenses': 'Expense',
+    'Security Expenses': 'Expense',
+    'Maintenance Expenses': 'Expense',
+    'Equipment': 'Expense',
+    'Cleaning': 'Expense',
+    'Affiliations': 'Expense',
+    'Concert Expenses': 'Expense',
+    'Compliance Fees': 'Expense',
+    'Sporting Activities': 'Expense',
+    'Trust Expenses': 'Expense',
+    'Transportation Expenses': 'Expense',
+    'Rent': 'Expense',
+    'Excursions': 'Expense',
+
+    # Assets/Liabilities/Equity
+    'Assets': 'Asset',
+    'Liabilities': 'Liability',
+    'Equity': 'Equity',
+    
+    # Transfers
+    'Inter Account Transfers': 'Transfer',
+    
+    # Default
+    'Uncategorized': 'Unknown'
+}
+
 def categorize_transactions(df):
     """
     Categorize transactions based on description keywords.
     """
-    # Define account mappings in a more structured way
-    account_mappings = {
-        # INCOME CATEGORIES
-        'Income from Services': [
-            'Service Income', 'Consulting Income', 'Freelance Income', 'FNB OB Pmt Nutri Feeds'
-        ],
-        'Investment Income': [
-            'Interest Earned', 'Dividend'
-        ],
-        
-        # EXPENSE CATEGORIES
-        # Bank Related
-        'Bank Charges': [
-            'Penalty Interest', 'Service Fee', 'Bank Charges', 
-            'Non FNB Withdrawal Fees', 'Monthly Fees', 'Service Fees',
-            'Bank Charge', 'Account Fee', 'Item Fee', 'Fee', 'Fees',
-            'Manual Reversal Fee', 'Unsuccessful F Declined', 'Unpaid No Funds',
-            'Fee Tcib', 'Swift Commission', 'Replacement Fee', 'Card Fee',
-            'Commission', 'Schd Trxn', 'Unpaid No Funds 01', 'Dr.Int.Rate',
-            '!ERROR: unparsable description text!', 'Card POS Unsuccessful F Declined',
-            'Bank Charges'
-        ],
-        
-        # Transportation
-        'Fuel Expense': [
-            'Fuel', 'Engen', 'Total', 'Sasol', 'Trac Diamond Plaza', 'Doornpoort', 
-            'Astron Energy', 'Petrol', 'BP', 'Caltex', 'Vw Parts', 'Engine Parts Luc','Fuel Purchase','Fuel Purchase Total','Fuel Purchase Engen','Fuel Purchase Sasol','Fuel Purchase Trac Diamond Plaza','Fuel Purchase','Fuel Purchase Astron Energy','Fuel Purchase BP','Fuel Purchase Caltex','Fuel Purchase Engen Linksfield Mo 428104*2012','Fuel Purchase Sasol Houghton 428104*2012 ','POS Purchase Total Boksburg Moto 428104*2012', 'Fuel Purchase Sasol Houghton 428104*2012','POS Purchase Astron Energy Cyril 428104*2012','POS Purchase Engen Bramley 428104*2012','POS Purchase Baobab Plaza 428104*2012','POS Purchase Doornpoort 428104*2012','POS Purchase Trac Diamond Plaza 428104*2012','POS Purchase Engen Linksfield Mo 428104*2012','POS Purchase Sasol Houghton 428104*2012 ','POS Purchase Total Boksburg Moto 428104*2012', 'Fuel Purchase Engen Linksfield Mo 428104*2012','Fuel Purchase Sasol Cosmo City 428104*2012'
-        ],
-        'Toll Fees': [
-            'Plaza', 'Toll', 'Baobab Plaza', 'Capricorn Plaza', 'Kranskop Plaza',
-            'Nyl Plaza', 'Carousel', 'Pumulani', 'Middleburg Tap','POS Purchase Middleburg Tap N Go', 'Doornkop Plaza', 'Toll Fees', 'Toll Fees Plaza', 'Toll Fees Trac Diamond Plaza','POS Purchase Kranskop Plaza 428104*2012','POS Purchase Capricorn Plaza 428104*2012','POS Purchase Nyl Plaza 428104*2012 ','POS Purchase Doornkop Plaza 428104*2012 '
-        ],
-        'Vehicle Maintenance': [
-            'Parts', 'Engine Parts', 'Truck Spares', 'Vw Parts', 'Engine Parts Luc','FNB App Payment To Engine Parts Engine Parts Luc','FNB App Payment To Masikize Truck Spares'
-        ],
-        'Vehicle Hire': [
-            'Car Hire', 'Car Rental', 'Truck Hire', 'Quantum Hire', 'Rentals', 
-            'Outward Swift R024', 'Ez Truck Hire', 'Car Rental'
-        ],
-        'Travelling Expense': [
-            'Uber', 'Taxi', 'Flight'
-        ],
-        
-        # Office Expenses
-        'Stationery and Printing': [
-            'Game', 'Cenecon', 'Stationery', 'Office', 'Printing', 'Paper', 'POS Purchase Game',
-            'Stationery', 'Printer Cartridges', 'Ink for Printers'
-        ],
-        'Telephone Expense': [
-            'Airtime', 'Topup', 'Telkom', 'Vodacom', 'MTN', 'Cell C',
-            'Telephone & Utilities'
-        ],
-        'Internet Expense': [
-            'Wifi', 'Internet', 'Home Wifi', 'Fibre',
-            'Internet ADSL & Hosting'
-        ],
-        'Business Equipment': [
-            'Verimark', 'African Electro', 'Incredible', 'Hpy*', 
-            'Electronic', 'POS Consultin', 'Ikh*E POS', 'Yoco', 'CSB Cosmo City','POS Purchase Bwh Northgate 428104*2012'
-        ],
-        
-        # Personnel Expenses
-        'Salaries and Wages': [
-            'Driver', 'Salary', 'Tendai', 'Bonakele', 'Ncube', 'Ze', 'Send Money',
-            'Salaries', 'Wages', 'Payroll', 'Staff Payment', 'Employee Payment','Settlement',
-            'Salaries & Wages'
-        ],
-        'Director Remunerations': [
-             'FNB App Payment To Lk', 'FNB App Payment To Lucky', 'FNB App Payment To Gu', 'FNB App Payment To Gr', 'FNB App Payment To G', 'FNB App Rtc Pmt To Lucky','FNB App Rtc Pmt To Lucky Nhlanhla','FNB App Rtc Pmt To Aunty Lucky','FNB App Rtc Pmt To Qiniso Nsele Lucky','FNB App Rtc Pmt To Lucky Mav Logistics','FNB App Payment To Luc Lucky','FNB App Rtc Pmt To Lucky Lucky Allowance'
-        ],
-        
-        # Business Operations
-        'Business Meetings': [
-            'Nandos', 'Mcd', 'KFC', 'Chicken Licken', 'Tres Jolie', 'MCP', 'Lunch',
-            'Steers', 'Galitos', 'Nizams', 'Newscafe', 'Tonys Ca', 'Snack Shop',
-            'Rocky Liquor', 'Avianto',
-            'Refreshments / Entertainment expences'
-        ],
-        'Outsourced Services': [
-            'Transport', 'Masik', 'Luc Trs', 'Mas', 'Samantha Mas Logistics', 'Lucky Nikelo Logistics','FNB App Payment To Lucky Nikelo Logistics',
-            'Outsourced Services'
-        ],
-        'Supplier Payments': [
-            'Makhosin', 'Masikize', 'Supplier', 'Vendor'
-        ],
-        
-        # Household Expenses
-        'Household Expense': [
-            'Grocery', 'Shoprite', 'Food', 'Ndoziz Buy', 'Beder Cash And Chic',
-            'Diamond Hill', 'Checkers', 'Woolworths', 'PNP', 'Spar', 'Grocc',
-            'Gro ', 'Makro', 'Edgars', 'Markham', 'Clicks', 'Dischem', 'Pharmacy',
-            'BBW', 'Cotton Lounge', 'Crazy Store', 'Jet', 'MRP', 'Mrprice',
-            'Euro Rivonia', 'Ok Minimark', 'Valueco', 'Csb Cosmo City',
-            'Braamfontein Superm', 'Mall', 'British A', 'Cellini', 'Ladies Fash',
-            'Cash Build', 'Butchery', 'Valley View', 'Eden Perfumes', 'Bramfontein Sup','POS Purchase S2S*Salamudestasupe 428104*2012 '
-        ],
-        
-        # Personal Expenses
-        'Drawings': [
-            'ATM', 'Cash Advanc', 'Withdrawal', 'Cashback', 'Family Support'
-        ],
-        'Entertainment': [
-            'DSTV', 'Ticketpros', 'Movies', 'Cinema', 'Liquorshop'
-        ],
-        'Cosmetics Expense': [
-            'Cosmetics', 'Umumodi', 'Perfume'
-        ],
-        
-        # Financial Expenses
-        'Insurance': [
-            'FNB Insure', 'Internal Debit Order', 'Insurance'
-        ],
-        'Interest Paid': [
-            'Int On Debit Balance', 'Loan Interest'
-        ],
-        'Bond Payment': [
-             'Mavondo', 'Rental', 'Rent', 'Mortgage', 'FNB App Transfer To','FNB App Payment To Flat'
-        ],
-        
-        # Other Expenses
-        'Educational Expenses': [
-            'Sch Fees', 'School', 'Education', 'Computer Lessons', 'Extra Lessons', 'AmandaS Schoolfees',
-            'Simphiwe', 'Pathfinder', 'Kids For Kids', 'School Fees', 'School Transport', 'School Uniform',
-            'Educational Aids', 'Learner Support Material', 'Education and Training (Staff)'
-        ],
-        'Donations': [
-            'Father\'S Day', 'Penlope Mail', 'Funeral', 'Donation',
-            'Donations / Gifts'
-        ],
-        'Investment Expense': [
-            'Invest', 'Investment', 'Shares'
-        ],
-        'Electricity': [
-            'Electricity Prepaid', 'Eskom',
-            'Electricity'
-        ],
-        
-        # ASSET/LIABILITY CATEGORIES
-        'Assets': [
-            'Furniture', 'Equipment', 'Vehicle Purchase'
-        ],
-        'Liabilities': [
-            'Loan', 'Debt', 'Credit Card', 'Payable'
-        ],
-        'Equity': [
-            'Drawings', 'Retained Earnings', 'Capital'
-        ],
-        
-        # TRANSFER CATEGORIES
-        'Inter Account Transfers': [
-            'Penlope Investments', 'Penelope Investments', 'Transfer Between Accounts'
-        ],
-        'Miscellaneous': [
-            'Transfer To Trf', 'Transfer To Msu', 'Transfer To Ndu',
-            'Transfer To Ukn', 'Transfer To Chantelle', 'Transfer To Sleeping Bag',
-            'Transfer To Amn', 'Transfer To Mnc', 'Transfer To Sk', 'Liquorshop Cosmo',
-            '4624616', 'Payment To Msu', 'Payment To Ndu',
-            'S2S*Salamudestasupe', 'Steers Balfour',
-            'POS Purchase S2S*Salamudestasupe 428104*2012 03 Sep','FNB App Transfer To N'
-        ],
-        
-        # Additional new categories
-        'Service Contracts': [
-            'Service contract Copiers'
-        ],
-        'Professional Fees': [
-            'Audit Fees', 'Accounting Services', 'Legal Fees'
-        ],
-        'Software Expenses': [
-            'Computer Software and Licences'
-        ],
-        'Security Expenses': [
-            'Security - Buildings/ Grounds'
-        ],
-        'Maintenance Expenses': [
-            'Maintenance - Assets and Equiptment', 'Maintenance - Buildings',
-            'Maintenance - Sport Facilities', 'Maintenance - Grounds'
-        ],
-        'Equipment': [
-            'Tools / Equiptment', 'Protective Clothing'
-        ],
-        'Cleaning': [
-            'Cleaning aids', 'Cleaning Material'
-        ],
-        'Affiliations': [
-            'Affiliations', 'Badges'
-        ],
-        'Concert Expenses': [
-            'Concert Facilitated', 'Concert Presented'
-        ],
-        'Compliance Fees': [
-            'Compliance Fees (COIDA)'
-        ],
-        'Sporting Activities': [
-            'Sporting Activities'
-        ],
-        'Trust Expenses': [
-            'Trust Expenses'
-        ],
-        'Transportation Expenses': [
-            'Fuel & Other Transport costs'
-        ],
-        'Rent': [
-            'Rent'
-        ],
-        'Excursions': [
-            'Excursions'
-        ],
-    }
-
-    # Add Account column with default value
-    df['Account'] = 'Uncategorized'
-    
-    # Case-insensitive categorization
-    for account, keywords in account_mappings.items():
+
+    # Case-insensitive categorization (descriptions are lowercased once up
+    # front rather than re-lowercased for every one of the keywords). The
+    # keyword passes run over the distinct descriptions only - recurring
+    # rows collapse to one entry - and each pass scans just the distinct
+    # strings still uncategorized, stopping outright once every one has an
+    # account, while keeping the exact first-matching-keyword-wins
+    # precedence of scanning keyword by keyword. The verdicts are then
+    # mapped back onto the rows.
+    descriptions_lower = df['description'].astype(str).str.lower()
+    unique_desc = pd.Series(descriptions_lower.unique())
+    unique_account = pd.Series('Uncategorized', index=unique_desc.index)
+    uncategorized = pd.Series(True, index=unique_desc.index)
+    for account, keywords in ACCOUNT_MAPPINGS.items():
+        if not uncategorized.any():
+            break
         for keyword in keywords:
-            mask = (df['Account'] == 'Uncategorized') & df['description'].astype(str).str.lower().str.contains(keyword.lower(), na=False)
-            df.loc[mask, 'Account'] = account
+            remaining = unique_desc[uncategorized]
+            hits = remaining.index[remaining.str.contains(keyword.lower(), na=False)]
+            if len(hits):
+                unique_account[hits] = account
+                uncategorized[hits] = False
+    df['Account'] = descriptions_lower.map(
+        pd.Series(unique_account.values, index=unique_desc.values))
     
     # Additional categorization rules from audit analysis
-    # Handle FNB App payments and transfers
-    fnb_app_mask = df['description'].astype(str).str.contains('FNB App', case=False, na=False)
-    df.loc[fnb_app_mask & df['description'].str.contains('Gro|Grocc', case=False, na=False), 'Account'] = 'Household Expense'
-    df.loc[fnb_app_mask & df['description'].str.contains('Petrol', case=False, na=False), 'Account'] = 'Fuel Expense'
-    df.loc[fnb_app_mask & df['description'].str.contains('Car|Rental|Hire', case=False, na=False), 'Account'] = 'Vehicle Hire'
-    
+    # Handle FNB App payments and transfers. These reuse the lowercased
+    # descriptions from the primary pass (no further astype/case=False
+    # copies), and the Gro/Petrol/Car scans only run over the FNB App rows
+    fnb_app_mask = descriptions_lower.str.contains('fnb app', na=False)
+    if fnb_app_mask.any():
+        fnb_app_desc = descriptions_lower[fnb_app_mask]
+        for pattern, account in (
+            ('gro|grocc', 'Household Expense'),
+            ('petrol', 'Fuel Expense'),
+            ('car|rental|hire', 'Vehicle Hire'),
+        ):
+            df.loc[fnb_app_desc.index[fnb_app_desc.str.contains(pattern, na=False)], 'Account'] = account
+
     # Additional categorization rules
-    credit_mask = (df['Type'] == 'Credit') & (~df['description'].astype(str).str.contains(
-        'Int|Interest|Service Fee', case=False, na=False))
+    credit_mask = (df['Type'] == 'Credit') & (~descriptions_lower.str.contains(
+        'int|interest|service fee', na=False))
     df.loc[credit_mask & (df['Account'] == 'Uncategorized'), 'Account'] = 'Income from Services'
     
-    # Define account types mapping
-    account_types = {
-        # Income
-        'Income from Services': 'Income',
-        'Investment Income': 'Income',
-        
-        # Expenses
-        'Bank Charges': 'Expense',
-        'Fuel Expense': 'Expense',
-        'Toll Fees': 'Expense',
-        'Vehicle Maintenance': 'Expense',
-        'Vehicle Hire': 'Expense',
-        'Travelling Expense': 'Expense',
-        'Stationery and Printing': 'Expense',
-        'Telephone Expense': 'Expense',
-        'Internet Expense': 'Expense',
-        'Business Equipment': 'Expense',
-        'Salaries and Wages': 'Expense',
-        'Director Remunerations': 'Expense',
-        'Business Meetings': 'Expense',
-        'Outsourced Services': 'Expense',
-        'Supplier Payments': 'Expense',
-        'Household Expense': 'Expense',
-        'Drawings': 'Equity',
-        'Entertainment': 'Expense',
-        'Cosmetics Expense': 'Expense',
-        'Insurance': 'Expense',
-        'Interest Paid': 'Expense',
-        'Bond Payment': 'Expense',
-        'Educational Expenses': 'Expense',
-        'Donations': 'Expense',
-        'Investment Expense': 'Expense',
-        'Electricity': 'Expense',
-        'Service Contracts': 'Expense',
-        'Professional Fees': 'Expense',
-        'Software Expenses': 'Expense',
-        'Security Expenses': 'Expense',
-        'Maintenance Expenses': 'Expense',
-        'Equipment': 'Expense',
-        'Cleaning': 'Expense',
-        'Affiliations': 'Expense',
-        'Concert Expenses': 'Expense',
-        'Compliance Fees': 'Expense',
-        'Sporting Activities': 'Expense',
-        'Trust Expenses': 'Expense',
-        'Transportation Expenses': 'Expense',
-        'Rent': 'Expense',
-        'Excursions': 'Expense',
-
-        # Assets/Liabilities/Equity
-        'Assets': 'Asset',
-        'Liabilities': 'Liability',
-        'Equity': 'Equity',
-        
-        # Transfers
-        'Inter Account Transfers': 'Transfer',
-        
-        # Default
-        'Uncategorized': 'Unknown'
-    }
-    
-    df['Account Type'] = df['Account'].map(account_types)
     
+    df['Account Type'] = df['Account'].map(ACCOUNT_TYPES)
+
+    # The group keys used downstream are low-cardinality strings; as
+    # categoricals the groupbys hash small integer codes instead of full
+    # Python strings. Categories are inferred from the data (and therefore
+    # lexicographically ordered), so sort_values output is unchanged, and
+    # every groupby on these keys passes observed=True so unused categories
+    # cannot fabricate empty groups.
+    for column in ('Account', 'Account Type', 'Type'):
+        df[column] = df[column].astype('category')
+
     return df
 
-def generate_trial_balance(df):
+def aggregate_account_totals(df):
+    """
+    Sum Debit/Credit (and derive Net) per (Account Type, Account) pair.
+
+    Both the trial balance and the management accounts are views over this
+    one aggregation, so callers producing several reports can group the
+    cashbook once and share the result.
+    """
+    # Account Type is 1:1 with Account, so grouping on both keys recovers
+    # the type in the same aggregation pass instead of a second groupby
+    # plus map join (dropna=False keeps any account with an unmapped type)
+    account_totals = df.groupby(
+        ['Account Type', 'Account'], observed=True, dropna=False, as_index=False
+    ).agg(Debit=('Debit', 'sum'), Credit=('Credit', 'sum'))
+
+    account_totals['Net'] = account_totals['Debit'] - account_totals['Credit']
+    return account_totals
+
+def generate_trial_balance(df, account_totals=None):
     """
     Generate a trial balance from the categorized transactions.
+    Pass a precomputed aggregate_account_totals frame to skip the groupby.
     """
-    trial_balance = df.groupby('Account').agg({
-        'Debit': 'sum',
-        'Credit': 'sum'
-    }).reset_index()
-    
-    trial_balance['Net'] = trial_balance['Debit'] - trial_balance['Credit']
-    trial_balance['Account Type'] = trial_balance['Account'].map(
-        df.groupby('Account')['Account Type'].first())
+    if account_totals is None:
+        account_totals = aggregate_account_totals(df)
+
+    trial_balance = account_totals[['Account', 'Debit', 'Credit', 'Net', 'Account Type']]
     
     # Sort by account type and name
     trial_balance = trial_balance.sort_values(['Account Type', 'Account'])
@@ -414,18 +515,12 @@ def generate_trial_balance(df):
     
     return trial_balance
 
-def generate_management_accounts(df):
+def generate_management_accounts(account_totals):
     """
-    Generate management accounts from the processed data.
+    Generate management accounts from the per-account totals produced by
+    aggregate_account_totals (shared with the trial balance rather than
+    re-grouping the full cashbook).
     """
-    # Calculate totals by account type
-    account_totals = df.groupby(['Account Type', 'Account']).agg({
-        'Debit': 'sum',
-        'Credit': 'sum'
-    }).reset_index()
-    
-    account_totals['Net'] = account_totals['Debit'] - account_totals['Credit']
-    
     # Income Statement
     income_accounts = account_totals[account_totals['Account Type'] == 'Income']
     expense_accounts = account_totals[account_totals['Account Type'] == 'Expense']
@@ -455,67 +550,73 @@ def generate_cashbook_excel(df, output_path):
     """
     Generate an Excel cashbook with management accounts.
     """
-    with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-        # Create monthly summary
-        monthly_summary = df.groupby([pd.Grouper(key='date', freq='ME'), 'Account']).agg({
+    # xlsxwriter is lighter than openpyxl for write-only output, and its
+    # datetime_format renders the date columns as yyyy-mm-dd at write
+    # time, so no pre-formatted string copies of the frames are needed.
+    # Its constant_memory mode must NOT be enabled here: pandas writes
+    # each frame column by column, and constant_memory silently discards
+    # writes to rows that have already been flushed, leaving every column
+    # after the first empty except on the final row.
+    with pd.ExcelWriter(
+        output_path,
+        engine='xlsxwriter',
+        datetime_format='yyyy-mm-dd',
+    ) as writer:
+        # Create monthly summary, grouping on precomputed month periods
+        # (compared as integer codes) rather than re-binning the datetime
+        # column per row through pd.Grouper
+        monthly_summary = df.groupby(
+            [df['date'].dt.to_period('M').rename('date'), 'Account'], observed=True
+        ).agg({
             'Debit': 'sum',
             'Credit': 'sum'
         }).reset_index()
-        
+
+        # Restore the month-end timestamps the date Grouper used to emit
+        monthly_summary['date'] = (
+            monthly_summary['date'].dt.to_timestamp(how='end').dt.normalize()
+        )
+
         # Calculate Net after aggregation
         monthly_summary['Net'] = monthly_summary['Debit'] - monthly_summary['Credit']
-        
-        # Write each sheet
-        # Format the date column before writing to Excel
-        df_formatted = df.copy()
-        df_formatted['date'] = df_formatted['date'].dt.strftime('%Y-%m-%d')
-        
-        monthly_summary_formatted = monthly_summary.copy()
-        monthly_summary_formatted['date'] = monthly_summary_formatted['date'].dt.strftime('%Y-%m-%d')
-        
-        # Write to Excel
-        df_formatted.to_excel(writer, sheet_name='Detailed Transactions', index=False)
-        monthly_summary_formatted.to_excel(writer, sheet_name='Monthly Summary', index=False)
-        
-        # Generate and write trial balance
+
+        # Generate trial balance
         trial_balance = generate_trial_balance(df)
-        trial_balance.to_excel(writer, sheet_name='Trial Balance', index=False)
-        
-        # Format worksheets
-        for sheet_name in writer.sheets:
-            worksheet = writer.sheets[sheet_name]
-            
-            # Adjust column widths
-            for idx, col in enumerate(worksheet.columns, 1):
-                worksheet.column_dimensions[get_column_letter(idx)].width = 15
-                
-            # Format date columns to show as dates
-            if sheet_name in ['Detailed Transactions', 'Monthly Summary']:
-                # Format the date column (assuming it's the first column)
-                for cell in worksheet['A'][1:]:  # Skip header row
-                    try:
-                        cell.number_format = 'yyyy-mm-dd'
-                    except:
-                        pass
 
-if __name__ == "__main__":
+        # Write each sheet and set its column widths with one column-level
+        # call per sheet
+        for sheet_name, frame in (
+            ('Detailed Transactions', df),
+            ('Monthly Summary', monthly_summary),
+            ('Trial Balance', trial_balance),
+        ):
+            frame.to_excel(writer, sheet_name=sheet_name, index=False)
+            writer.sheets[sheet_name].set_column(0, len(frame.columns) - 1, 15)
+
+def main():
+    """Combine the year's CSV exports and write the annual cashbook.
+
+    Callable in-process (e.g. from the custom parser workflow) as well as
+    via the command line; errors propagate to the caller."""
     # Set the fiscal year date range
     start_date = '2023-03-01'
     end_date = '2024-02-28'
-    
+
     # Get the input and output paths
     input_dir = '/Users/sthwalonyoni/pdf-bank-statement-parser/data/input/2024'
     output_path = os.path.join(os.path.dirname(input_dir), "Annual_Cashbook_2024.xlsx")
-    
+
+    # Combine and process CSV files
+    df = combine_csv_files(input_dir, start_date, end_date)
+    df = clean_and_process_csv(df)
+
+    # Generate the Excel cashbook
+    generate_cashbook_excel(df, output_path)
+    print(f"\nAnnual cashbook generated successfully: {output_path}")
+
+if __name__ == "__main__":
     try:
-        # Combine and process CSV files
-        df = combine_csv_files(input_dir, start_date, end_date)
-        df = clean_and_process_csv(df)
-        
-        # Generate the Excel cashbook
-        generate_cashbook_excel(df, output_path)
-        print(f"\nAnnual cashbook generated successfully: {output_path}")
-        
+        main()
     except Exception as e:
         import traceback
         print(f"\nError: {e}")
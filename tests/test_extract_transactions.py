@@ -0,0 +1,52 @@
+"""Regression tests for the page-scan regex in extract_transactions.
+
+PDFium terminates extracted lines with "\r\n", so the scan pattern must
+match rows whether page text arrives with "\n" or "\r\n" line endings.
+"""
+
+import pytest
+
+pytest.importorskip("pypdfium2")
+
+from pdf_bank_statement_parser.parse.extract_transactions import _PAGE_SCAN_RE
+
+SAMPLE_PAGE_LINES = (
+    "Statement Period : 01 March 2023 to 31 March 2023",
+    "Opening Balance 1,000.00 Cr",
+    "01 Mar POS Purchase Shoprite 100.00 900.00Cr",
+    "02 Mar Magtape Debit Insurance 50.00 850.00Cr 3.50",
+    "Closing Balance 850.00 Cr",
+    "",
+)
+
+
+@pytest.mark.parametrize("line_ending", ["\n", "\r\n"], ids=["LF", "CRLF"])
+def test_page_scan_matches_both_line_endings(line_ending):
+    page_text = line_ending.join(SAMPLE_PAGE_LINES)
+
+    transactions = []
+    opening_balances = []
+    closing_balances = []
+    for match in _PAGE_SCAN_RE.finditer(page_text):
+        if match["day"] is not None:
+            transactions.append(
+                (
+                    match["day"],
+                    match["month"],
+                    match["desc"].strip(),
+                    match["amount"],
+                    match["balance"],
+                    match["fee"],
+                )
+            )
+        elif match["opening"] is not None:
+            opening_balances.append(match["opening"])
+        else:
+            closing_balances.append(match["closing"])
+
+    assert transactions == [
+        ("01", "Mar", "POS Purchase Shoprite", "100.00", "900.00Cr", None),
+        ("02", "Mar", "Magtape Debit Insurance", "50.00", "850.00Cr", "3.50"),
+    ]
+    assert opening_balances == ["1,000.00 Cr"]
+    assert closing_balances == ["850.00 Cr"]
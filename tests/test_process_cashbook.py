@@ -0,0 +1,72 @@
+"""Write-then-read-back test for the Excel cashbook export.
+
+Guards against writer options (e.g. xlsxwriter's constant_memory mode)
+that silently corrupt the workbook: pandas writes each sheet column by
+column, and constant_memory discards writes to already-flushed rows, so
+a corrupted export reads back with every column after the first empty.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("xlsxwriter")
+pytest.importorskip("openpyxl")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from process_cashbook import generate_cashbook_excel
+
+
+def test_cashbook_excel_round_trips(tmp_path):
+    df = pd.DataFrame(
+        {
+            "date": pd.to_datetime(
+                ["2023-03-01", "2023-03-15", "2023-04-02", "2023-04-20"]
+            ),
+            "description": [
+                "POS Purchase Shoprite",
+                "Payment From Client A",
+                "Magtape Debit Insurance",
+                "Payment From Client B",
+            ],
+            "amount": [-100.0, 1500.0, -50.0, 2000.0],
+            "Type": ["Debit", "Credit", "Debit", "Credit"],
+            "Debit": [100.0, 0.0, 50.0, 0.0],
+            "Credit": [0.0, 1500.0, 0.0, 2000.0],
+            "Account": [
+                "Household Expense",
+                "Income from Services",
+                "Insurance Expense",
+                "Income from Services",
+            ],
+            "Account Type": ["Expense", "Income", "Expense", "Income"],
+        }
+    )
+    output_path = tmp_path / "cashbook.xlsx"
+
+    generate_cashbook_excel(df, output_path)
+
+    read_back = pd.read_excel(output_path, sheet_name="Detailed Transactions")
+
+    # every row and every column must survive the round trip intact
+    assert len(read_back) == len(df)
+    assert list(read_back.columns) == list(df.columns)
+    assert not read_back.isna().any().any()
+    assert read_back["description"].tolist() == df["description"].tolist()
+    assert read_back["Debit"].tolist() == df["Debit"].tolist()
+    assert read_back["Credit"].tolist() == df["Credit"].tolist()
+    assert pd.to_datetime(read_back["date"]).tolist() == df["date"].tolist()
+
+    summary = pd.read_excel(output_path, sheet_name="Monthly Summary")
+    assert not summary.drop(columns=["date"]).isna().any().any()
+    assert summary["Debit"].sum() == df["Debit"].sum()
+    assert summary["Credit"].sum() == df["Credit"].sum()
+
+    trial_balance = pd.read_excel(output_path, sheet_name="Trial Balance")
+    totals_row = trial_balance[trial_balance["Account"] == "TOTAL"]
+    assert len(totals_row) == 1
+    assert totals_row["Debit"].iloc[0] == df["Debit"].sum()
+    assert totals_row["Credit"].iloc[0] == df["Credit"].sum()